@@ -128,7 +128,13 @@ class InputHandler:
 
     @classmethod
     def from_file(cls, path: str) -> "InputHandler":
-        """Load key mappings from JSON file, or generate defaults if missing.
+        """Load key mappings from JSON file, or generate defaults if missing."""
+        return cls.from_dict(cls.load_bindings(path))
+
+    @classmethod
+    def load_bindings(cls, path: str) -> Dict:
+        """Parse the bindings JSON file, writing defaults first if missing.
+
         This function does not hardcode key values in code—defaults are
         written to a JSON file so users can edit them freely.
         """
@@ -140,8 +146,11 @@ class InputHandler:
                 json.dump(default, f, indent=2)
 
         with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            return json.load(f)
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "InputHandler":
+        """Build a handler from already-parsed bindings (same shape as the JSON)."""
         mappings: Dict[int, Dict[str, int]] = {}
         players = data.get("players", {})
         for pid_str, actions in players.items():
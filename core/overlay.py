@@ -0,0 +1,37 @@
+"""
+Translucent fill surfaces shared by the game draw code.
+Flash and status overlays are plain RGBA fills, so each (size, color) is
+built once in display format and reused every frame.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+
+
+# Some overlays keep changing (Box Stack's cut flash follows the cut width,
+# Sudoku's invalid flash fades), so the cache is bounded and drops the least
+# recently drawn entry once full.
+MAX_ENTRIES = 64
+
+_cache: "OrderedDict[Tuple[Tuple[int, int], Tuple[int, int, int, int]], pygame.Surface]" = OrderedDict()
+
+
+def translucent_box(size: Tuple[int, int], rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Return a surface of the given size filled with rgba (alpha included).
+
+    The returned surface is shared; blit it, don't draw on it.
+    """
+    key = (size, rgba)
+    surf = _cache.get(key)
+    if surf is not None:
+        _cache.move_to_end(key)
+        return surf
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.fill(rgba)
+    _cache[key] = surf
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return surf
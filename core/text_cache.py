@@ -0,0 +1,50 @@
+"""
+Shared cache of rendered text for the menus and the game HUDs.
+Both redraw the same strings (labels, scores, timers) over and over, so
+each (font, text, color) is rasterized once and the surface reused.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+import pygame
+
+
+class Text(NamedTuple):
+    """Rendered text plus its metrics, so centering needs no Surface calls."""
+    surf: pygame.Surface
+    w: int
+    h: int
+
+    def centered(self, cx: int, cy: int) -> Tuple[int, int]:
+        return (cx - self.w // 2, cy - self.h // 2)
+
+
+# Timers, scores and results rows keep producing new strings, so the cache
+# is bounded and drops the least recently drawn entry once full.
+MAX_ENTRIES = 512
+
+_cache: "OrderedDict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], Text]" = OrderedDict()
+
+
+def cached_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> Text:
+    """Return antialiased text in display format, rendering on a miss.
+
+    The surface is shared; blit it, don't draw on it.
+    """
+    key = (font, text, color)
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+        return cached
+    surf = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    cached = _cache[key] = Text(surf, surf.get_width(), surf.get_height())
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return cached
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Surface-only form of cached_text() for code that blits at fixed spots."""
+    return cached_text(font, text, color).surf
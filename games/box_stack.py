@@ -2,6 +2,9 @@ from __future__ import annotations
 import pygame
 from typing import List, Optional, Tuple
 
+from core.overlay import translucent_box
+from core.text_cache import render_text
+
 
 class BoxStackGame:
     BEST_SCORE: int = 0  # session best
@@ -202,13 +205,11 @@ class BoxStackGame:
             pygame.draw.rect(surface, (250, 230, 210), self.active, 2)
         # Cut flash
         if self.cut_flash is not None and self.cut_flash_time > 0.0:
-            s = pygame.Surface((self.cut_flash.width, self.cut_flash.height), pygame.SRCALPHA)
-            s.fill((255, 230, 150, 160))
-            surface.blit(s, self.cut_flash.topleft)
+            surface.blit(translucent_box(self.cut_flash.size, (255, 230, 150, 160)), self.cut_flash.topleft)
         # HUD
-        h_text = font.render(f"Height: {self.score}", True, (255, 255, 255))
-        b_text = font.render(f"Best: {BoxStackGame.BEST_SCORE}", True, (230, 230, 230))
-        hint = font.render("Space/Click: Drop", True, (210, 210, 210))
+        h_text = render_text(font, f"Height: {self.score}", (255, 255, 255))
+        b_text = render_text(font, f"Best: {BoxStackGame.BEST_SCORE}", (230, 230, 230))
+        hint = render_text(font, "Space/Click: Drop", (210, 210, 210))
         surface.blit(h_text, (10, 10))
         surface.blit(b_text, (10, 34))
         surface.blit(hint, (10, 58))
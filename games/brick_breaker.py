@@ -2,6 +2,8 @@ from __future__ import annotations
 import random
 import pygame
 
+from core.text_cache import render_text
+
 class BrickBreakerGame:
     def __init__(self, bounds: pygame.Rect):
         self.bounds = bounds
@@ -154,12 +156,9 @@ class BrickBreakerGame:
                     self.ball_y = float(self.paddle.top - self.ball_size - 1)
                 ball = self._ball_rect()
         # Brick collisions
-        hit_index = None
-        for i, b in enumerate(self.bricks):
-            if ball.colliderect(b):
-                hit_index = i
-                break
-        if hit_index is not None:
+        # First brick hit, scanned in C rather than a Python loop
+        hit_index = ball.collidelist(self.bricks)
+        if hit_index != -1:
             rect = self.bricks.pop(hit_index)
             self.score += 1
             prev = pygame.Rect(int(self.prev_ball_x), int(self.prev_ball_y), self.ball_size, self.ball_size)
@@ -218,7 +217,7 @@ class BrickBreakerGame:
         ball = self._ball_rect()
         pygame.draw.rect(surface, (240, 240, 240), ball)
         # HUD
-        stext = font.render(f"Score: {self.score}", True, (255, 255, 255))
+        stext = render_text(font, f"Score: {self.score}", (255, 255, 255))
         surface.blit(stext, (10, 10))
-        ltext = font.render(f"Lives: {self.lives}", True, (230, 230, 230))
+        ltext = render_text(font, f"Lives: {self.lives}", (230, 230, 230))
         surface.blit(ltext, (10, 34))
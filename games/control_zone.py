@@ -15,6 +15,8 @@ from typing import List, Tuple, Dict
 import random
 import pygame
 
+from core.overlay import translucent_box
+from core.text_cache import render_text
 from entities.player import HumanPlayer
 from games.survival import HAZARD_COLOR
 
@@ -259,17 +261,15 @@ class ControlZoneGame:
             pygame.draw.rect(surface, p.color, p.rect)
             if self.elapsed < self.stun_until[p.player_id]:
                 # White translucent overlay to indicate stun
-                overlay = pygame.Surface((p.rect.width, p.rect.height), pygame.SRCALPHA)
-                overlay.fill((255, 255, 255, 120))
-                surface.blit(overlay, p.rect.topleft)
+                surface.blit(translucent_box(p.rect.size, (255, 255, 255, 120)), p.rect.topleft)
 
         # HUD
-        t_text = font.render(f"Time Left: {max(0.0, self.match_time - self.elapsed):.1f}s", True, (255, 255, 255))
+        t_text = render_text(font, f"Time Left: {max(0.0, self.match_time - self.elapsed):.1f}s", (255, 255, 255))
         surface.blit(t_text, (10, 10))
         # Scores
         y = 36
         for p in self.players:
             val = self.zone_scores.get(p.player_id, 0.0)
-            line = font.render(f"{p.name}: {val:.1f}s", True, (230, 230, 230))
+            line = render_text(font, f"{p.name}: {val:.1f}s", (230, 230, 230))
             surface.blit(line, (10, y))
             y += 22
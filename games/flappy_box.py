@@ -4,6 +4,8 @@ from typing import List, Tuple, Optional
 
 import pygame
 
+from core.text_cache import render_text
+
 
 class FlappyBoxGame:
     """Singleplayer Flappy Bird–style game with box visuals."""
@@ -172,11 +174,11 @@ class FlappyBoxGame:
         pygame.draw.rect(surface, (255, 240, 200), self.player_rect, 2)
 
         # HUD
-        score_surf = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        best_surf = font.render(
-            f"Best: {FlappyBoxGame.BEST_SCORE}", True, (230, 230, 230)
+        score_surf = render_text(font, f"Score: {self.score}", (255, 255, 255))
+        best_surf = render_text(
+            font, f"Best: {FlappyBoxGame.BEST_SCORE}", (230, 230, 230)
         )
-        hint = font.render("Space/Click: Flap", True, (210, 210, 210))
+        hint = render_text(font, "Space/Click: Flap", (210, 210, 210))
         surface.blit(score_surf, (10, 10))
         surface.blit(best_surf, (10, 34))
         surface.blit(hint, (10, 58))
@@ -3,6 +3,8 @@ import random
 import pygame
 from typing import List, Tuple
 
+from core.text_cache import render_text
+
 
 class MazeRunnerGame:
     def __init__(self, bounds: pygame.Rect):
@@ -163,5 +165,5 @@ class MazeRunnerGame:
         pygame.draw.rect(surface, (200, 200, 240), pr)
         pygame.draw.rect(surface, (240, 240, 250), pr, 2)
         # HUD
-        t = font.render(f"Time: {self.elapsed:.1f}s", True, (255, 255, 255))
+        t = render_text(font, f"Time: {self.elapsed:.1f}s", (255, 255, 255))
         surface.blit(t, (10, 10))
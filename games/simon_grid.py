@@ -3,6 +3,8 @@ import random
 import pygame
 from typing import List, Optional, Tuple
 
+from core.text_cache import render_text
+
 class SimonGridGame:
     def __init__(self, bounds: pygame.Rect, grid_size: int = 3):
         self.bounds = bounds
@@ -163,8 +165,8 @@ class SimonGridGame:
             pygame.draw.rect(surface, color, rect)
             pygame.draw.rect(surface, self.color_outline, rect, 2)
         # HUD
-        round_text = font.render(f"Round: {len(self.sequence)}", True, (255, 255, 255))
+        round_text = render_text(font, f"Round: {len(self.sequence)}", (255, 255, 255))
         surface.blit(round_text, (10, 10))
         status = "Watch" if self.state == "show" else ("Your turn" if self.state == "input" else "Done")
-        stext = font.render(status, True, (220, 220, 230))
+        stext = render_text(font, status, (220, 220, 230))
         surface.blit(stext, (10, 34))
@@ -8,6 +8,8 @@ from typing import List, Tuple, Optional
 import random
 import pygame
 
+from core.text_cache import render_text
+
 CELL_SIZE = 20
 
 
@@ -138,5 +140,5 @@ class SnakeGame:
             rect = self._cell_rect(self.apple[0], self.apple[1])
             pygame.draw.rect(surface, (240, 84, 84), rect)
         # HUD
-        hud = font.render(f"Score: {self.score}", True, (255, 255, 255))
+        hud = render_text(font, f"Score: {self.score}", (255, 255, 255))
         surface.blit(hud, (10, 10))
@@ -12,6 +12,9 @@ from typing import List, Optional, Tuple
 import random
 import pygame
 
+from core.overlay import translucent_box
+from core.text_cache import render_text
+
 CELL_SIZE = 40
 GRID_SIZE = 9
 
@@ -307,7 +310,7 @@ class SudokuGame:
                 val = self.grid[r][c]
                 if val != 0:
                     color = (240, 240, 240) if self.locked[r][c] else (200, 220, 240)
-                    text = font.render(str(val), True, color)
+                    text = render_text(font, str(val), color)
                     surface.blit(text, (rect.centerx - text.get_width()//2, rect.centery - text.get_height()//2))
         # Grid lines (thicker at subgrid boundaries)
         for i in range(GRID_SIZE + 1):
@@ -320,18 +323,17 @@ class SudokuGame:
         if self.invalid_flash > 0.0:
             c, r = self.selected
             rect = self._cell_rect(c, r)
-            overlay = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            overlay.fill((255, 60, 60, int(120 * min(1.0, self.invalid_flash * 3))))
-            surface.blit(overlay, rect.topleft)
+            alpha = int(120 * min(1.0, self.invalid_flash * 3))
+            surface.blit(translucent_box(rect.size, (255, 60, 60, alpha)), rect.topleft)
         # HUD
-        hud = font.render(f"Time: {self.elapsed:.1f}s", True, (255, 255, 255))
+        hud = render_text(font, f"Time: {self.elapsed:.1f}s", (255, 255, 255))
         surface.blit(hud, (10, 10))
         # Level and puzzle HUD
         pcount = len(PRESET_PUZZLES_BY_LEVEL.get(self.level, []))
-        ptext = font.render(f"Level: {self.level.capitalize()}  Puzzle: {self.current_puzzle_index+1}/{pcount}", True, (220, 220, 230))
+        ptext = render_text(font, f"Level: {self.level.capitalize()}  Puzzle: {self.current_puzzle_index+1}/{pcount}", (220, 220, 230))
         surface.blit(ptext, (10, 34))
         # Reset button
         pygame.draw.rect(surface, (70, 70, 90), self.reset_btn_rect)
         pygame.draw.rect(surface, (180, 180, 220), self.reset_btn_rect, 2)
-        rtext = font.render("Reset", True, (240, 240, 240))
+        rtext = render_text(font, "Reset", (240, 240, 240))
         surface.blit(rtext, (self.reset_btn_rect.centerx - rtext.get_width()//2, self.reset_btn_rect.centery - rtext.get_height()//2))
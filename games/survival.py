@@ -18,6 +18,7 @@ import pygame
 # Distinct hazard base color (not used by any player colors), theme-friendly on dark bg
 HAZARD_COLOR = (255, 64, 192)  # electric magenta
 
+from core.text_cache import render_text
 from entities.player import Player, HumanPlayer
 
 
@@ -123,6 +124,8 @@ class SurvivalGame:
 
         # Move hazards and check collisions
         keep: List[Tuple[pygame.Rect, Tuple[float, float]]] = []
+        # Hazards are kept while still nearby (within expanded bounds)
+        expanded = self.bounds.inflate(120, 120)
         for rect, (vx, vy) in self.hazards:
             rect.x += int(vx * dt)
             rect.y += int(vy * dt)
@@ -130,8 +133,6 @@ class SurvivalGame:
             if rect.colliderect(self.player.rect):
                 self.is_over = True
                 return
-            # Keep if still nearby (within expanded bounds)
-            expanded = self.bounds.inflate(120, 120)
             if expanded.colliderect(rect):
                 keep.append((rect, (vx, vy)))
         self.hazards = keep
@@ -160,7 +161,7 @@ class SurvivalGame:
         # Player
         pygame.draw.rect(surface, self.player.color, self.player.rect)
         # HUD
-        t_text = font.render(f"Time: {self.elapsed:.1f}s", True, (255, 255, 255))
+        t_text = render_text(font, f"Time: {self.elapsed:.1f}s", (255, 255, 255))
         surface.blit(t_text, (10, 10))
 
 
@@ -273,23 +274,22 @@ class SurvivalPvpGame:
 
         # Move hazards and check collisions per player
         keep: List[Tuple[pygame.Rect, Tuple[float, float]]] = []
+        expanded = self.bounds.inflate(120, 120)
         for rect, (vx, vy) in self.hazards:
             rect.x += int(vx * dt)
             rect.y += int(vy * dt)
-            expanded = self.bounds.inflate(120, 120)
             if expanded.colliderect(rect):
                 keep.append((rect, (vx, vy)))
         self.hazards = keep
 
         # Collisions: eliminate on contact
+        hazard_rects = [rect for rect, _vel in keep]
         for p in self.players:
             if not self.alive[p.player_id]:
                 continue
-            for rect, _vel in self.hazards:
-                if rect.colliderect(p.rect):
-                    self.alive[p.player_id] = False
-                    self.elim_time[p.player_id] = self.elapsed
-                    break
+            if p.rect.collidelist(hazard_rects) != -1:
+                self.alive[p.player_id] = False
+                self.elim_time[p.player_id] = self.elapsed
 
         # Count survivors
         survivors = [pid for pid, ok in self.alive.items() if ok]
@@ -324,5 +324,5 @@ class SurvivalPvpGame:
             color = p.color
             pygame.draw.rect(surface, color, p.rect)
             pygame.draw.rect(surface, (230, 230, 230), p.rect, 2)
-            label = font.render(p.name, True, (230, 230, 230))
+            label = render_text(font, p.name, (230, 230, 230))
             surface.blit(label, (p.rect.centerx - label.get_width()//2, p.rect.top - label.get_height() - 2))
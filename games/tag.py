@@ -11,9 +11,10 @@ Rules:
 """
 from __future__ import annotations
 import random
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, NamedTuple, Tuple, Optional
 import pygame
 
+from core.text_cache import render_text
 from entities.player import Player
 
 
@@ -40,13 +41,22 @@ class Platform:
         self.last_dx = 0.0
 
 
+class TagSettings(NamedTuple):
+    """Match variants chosen in the Tag settings menu."""
+    double_jump: bool = False
+    map_index: int = 0
+    enable_moving: bool = False
+    enable_dropthrough: bool = False
+    enable_speed: bool = False
+
+
 class TagGame:
     def __init__(
         self,
         players: List[Player],
         bounds: pygame.Rect,
         match_time: int = 60,
-        settings: Optional[Dict[str, Any]] = None,
+        settings: Optional[TagSettings] = None,
     ):
         self.players = players
         self.bounds = bounds
@@ -54,12 +64,12 @@ class TagGame:
         self.remaining = float(match_time)
 
         # Settings / variants (with safe defaults)
-        s = settings or {}
-        self.map_index: int = int(s.get("map_index", 0)) % 3
-        self.double_jump_enabled: bool = bool(s.get("double_jump", False))
-        self.moving_enabled: bool = bool(s.get("enable_moving", False))
-        self.dropthrough_enabled: bool = bool(s.get("enable_dropthrough", False))
-        self.speed_enabled: bool = bool(s.get("enable_speed", False))
+        s = settings or TagSettings()
+        self.map_index: int = int(s.map_index) % 3
+        self.double_jump_enabled: bool = bool(s.double_jump)
+        self.moving_enabled: bool = bool(s.enable_moving)
+        self.dropthrough_enabled: bool = bool(s.enable_dropthrough)
+        self.speed_enabled: bool = bool(s.enable_speed)
 
         # Physics parameters
         self.gravity = 1400.0
@@ -437,9 +447,9 @@ class TagGame:
         it_text = f"IT: Player {self.current_it_id}"
         time_text = f"Time Left: {int(self.remaining)}s"
         hint_text = "Move: per-player left/right keys   Jump: per-player up key"
-        it_surf = font.render(it_text, True, (255, 255, 255))
-        time_surf = font.render(time_text, True, (255, 255, 255))
-        hint_surf = font.render(hint_text, True, (220, 220, 220))
+        it_surf = render_text(font, it_text, (255, 255, 255))
+        time_surf = render_text(font, time_text, (255, 255, 255))
+        hint_surf = render_text(font, hint_text, (220, 220, 220))
         surface.blit(it_surf, (self.bounds.left + 10, self.bounds.top + 8))
         surface.blit(time_surf, (self.bounds.left + 10, self.bounds.top + 32))
         surface.blit(hint_surf, (self.bounds.left + 10, self.bounds.top + 56))
@@ -4,6 +4,8 @@ from typing import List, Optional, Tuple
 
 import pygame
 
+from core.text_cache import render_text
+
 
 COLS = 10
 ROWS = 20
@@ -300,7 +302,7 @@ class TetrisBoxGame:
         if self.next_shape is None:
             return
         # Draw to the right of the board
-        label = font.render("Next", True, (230, 230, 230))
+        label = render_text(font, "Next", (230, 230, 230))
         label_pos = (self.board_rect.right + 24, self.board_rect.top)
         surface.blit(label, label_pos)
 
@@ -335,10 +337,10 @@ class TetrisBoxGame:
 
         # HUD
         hud_x = self.board_rect.left - 140
-        score_surf = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        level_surf = font.render(f"Level: {self.level}", True, (230, 230, 230))
-        lines_surf = font.render(f"Lines: {self.lines_cleared}", True, (220, 220, 220))
-        hint = font.render("Arrows: Move/Soft  Up/Space: Rotate", True, (200, 200, 210))
+        score_surf = render_text(font, f"Score: {self.score}", (255, 255, 255))
+        level_surf = render_text(font, f"Level: {self.level}", (230, 230, 230))
+        lines_surf = render_text(font, f"Lines: {self.lines_cleared}", (220, 220, 220))
+        hint = render_text(font, "Arrows: Move/Soft  Up/Space: Rotate", (200, 200, 210))
 
         surface.blit(score_surf, (hud_x, self.board_rect.top))
         surface.blit(level_surf, (hud_x, self.board_rect.top + 24))
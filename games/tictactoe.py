@@ -9,6 +9,8 @@ from typing import List, Optional, Tuple, Dict
 import random
 import pygame
 
+from core.text_cache import render_text
+
 
 class TicTacToeGame:
     def __init__(self, bounds: pygame.Rect, mode: str = "single", *,
@@ -223,14 +225,14 @@ class TicTacToeGame:
             turn_text = f"Turn: {'You' if owner == self.names[0] else 'Bot'} ({self.turn})"
         else:
             turn_text = f"Turn: {owner} ({self.turn})" if owner else f"Turn: {self.turn}"
-        hud = font.render(turn_text, True, (255, 255, 255))
+        hud = render_text(font, turn_text, (255, 255, 255))
         surface.blit(hud, (10, 10))
 
         # Scoreboard HUD (stacking)
         sc_a = self.scoreboard.get(self.names[0], 0)
         sc_b = self.scoreboard.get(self.names[1], 0)
-        s1 = font.render(f"{self.names[0]}: {sc_a}", True, (230, 230, 230))
-        s2 = font.render(f"{self.names[1]}: {sc_b}", True, (230, 230, 230))
+        s1 = render_text(font, f"{self.names[0]}: {sc_a}", (230, 230, 230))
+        s2 = render_text(font, f"{self.names[1]}: {sc_b}", (230, 230, 230))
         surface.blit(s1, (10, 36))
         surface.blit(s2, (10, 58))
 
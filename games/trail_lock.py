@@ -10,6 +10,8 @@ from typing import List, Tuple, Dict
 import random
 import pygame
 
+from core.overlay import translucent_box
+from core.text_cache import render_text
 from entities.player import HumanPlayer
 
 
@@ -49,11 +51,15 @@ class TrailLockGame:
 
         # Trails: list of (rect, color, owner_id) for rendering & collision
         self.trails: List[Tuple[pygame.Rect, Tuple[int, int, int], int]] = []
+        # The same trail rects grouped by owner, for Rect.collidelist()
+        self.trail_rects: Dict[int, List[pygame.Rect]] = {p.player_id: [] for p in players}
 
         self.reset_round()
 
     def reset_round(self):
         self.trails.clear()
+        for rects in self.trail_rects.values():
+            rects.clear()
         self.trails_active = False
         self.round_over = False
         self.round_over_timer = 0.0
@@ -137,6 +143,7 @@ class TrailLockGame:
                     margin = 6
                     trail_rect = prev.inflate(-margin, -margin)
                     self.trails.append((trail_rect, darker, p.player_id))
+                    self.trail_rects[p.player_id].append(trail_rect)
             # Update previous position
             self.prev_rect[p.player_id] = p.rect.copy()
 
@@ -161,11 +168,11 @@ class TrailLockGame:
         for p in self.players:
             if not self.alive[p.player_id]:
                 continue
-            for rect, _color, owner in self.trails:
+            for owner, rects in self.trail_rects.items():
                 # Do not eliminate on own trail to avoid instant self-hit
                 if owner == p.player_id:
                     continue
-                if rect.colliderect(p.rect):
+                if p.rect.collidelist(rects) != -1:
                     self.alive[p.player_id] = False
                     break
 
@@ -198,17 +205,15 @@ class TrailLockGame:
                 pygame.draw.rect(surface, (230, 230, 230), p.rect, 2)
             else:
                 # Faded box for eliminated
-                overlay = pygame.Surface((p.rect.width, p.rect.height), pygame.SRCALPHA)
-                overlay.fill((120, 120, 120, 140))
-                surface.blit(overlay, p.rect.topleft)
+                surface.blit(translucent_box(p.rect.size, (120, 120, 120, 140)), p.rect.topleft)
         # HUD: round info and scoreboard
         status = "Trails ON" if self.trails_active else "Get Ready"
-        hud = font.render(f"Round {self.round_index + 1} — {status}", True, (255, 255, 255))
+        hud = render_text(font, f"Round {self.round_index + 1} — {status}", (255, 255, 255))
         surface.blit(hud, (10, 10))
         y = 34
         for p in self.players:
             sc = self.score_board.get(p.player_id, 0)
-            line = font.render(f"{p.name}: {sc}", True, (230, 230, 230))
+            line = render_text(font, f"{p.name}: {sc}", (230, 230, 230))
             surface.blit(line, (10, y))
             y += 22
         # Inter-round banner
@@ -218,5 +223,5 @@ class TrailLockGame:
                 winner = next((p for p in self.players if p.player_id == self.round_winner), None)
                 if winner:
                     text = f"Round Winner: {winner.name}"
-            banner = font.render(text, True, (255, 240, 120))
+            banner = render_text(font, text, (255, 240, 120))
             surface.blit(banner, (surface.get_width()//2 - banner.get_width()//2, 10))
@@ -3,6 +3,8 @@ import random
 import pygame
 from typing import Optional, Tuple, List
 
+from core.text_cache import render_text
+
 
 class WhackABoxGame:
     def __init__(self, bounds: pygame.Rect, round_duration: float = 30.0):
@@ -128,9 +130,9 @@ class WhackABoxGame:
             flash_rect = pygame.Rect(cx - r, cy - r, r * 2, r * 2)
             pygame.draw.ellipse(surface, (240, 240, 240), flash_rect, 2)
         # HUD
-        t_text = font.render(f"Time: {self.time_remaining:4.1f}s", True, (255, 255, 255))
-        s_text = font.render(f"Score: {self.score}", True, (240, 240, 240))
-        m_text = font.render(f"Misses: {self.misses}", True, (220, 220, 220))
+        t_text = render_text(font, f"Time: {self.time_remaining:4.1f}s", (255, 255, 255))
+        s_text = render_text(font, f"Score: {self.score}", (240, 240, 240))
+        m_text = render_text(font, f"Misses: {self.misses}", (220, 220, 220))
         surface.blit(t_text, (10, 10))
         surface.blit(s_text, (10, 34))
         surface.blit(m_text, (10, 58))
@@ -2,6 +2,8 @@ from __future__ import annotations
 import pygame
 from typing import List, Tuple, Optional
 
+from core.text_cache import render_text
+
 
 class ZipBoxGame:
     """Linked-number path puzzle inspired by LinkedIn's Zip.
@@ -357,7 +359,7 @@ class ZipBoxGame:
             rect = self._cell_rect(nx, ny)
             pygame.draw.rect(surface, (20, 20, 28), rect)
             pygame.draw.rect(surface, (240, 240, 250), rect, 2)
-            text = font.render(str(idx), True, (240, 240, 250))
+            text = render_text(font, str(idx), (240, 240, 250))
             surface.blit(
                 text,
                 (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2),
@@ -370,9 +372,9 @@ class ZipBoxGame:
             pygame.draw.rect(surface, (240, 240, 255), rect, 2)
 
         # HUD
-        level_label = font.render(f"Level {self.current_level + 1}/{len(self.levels)}", True, (230, 230, 230))
-        time_label = font.render(f"Time: {self.elapsed:0.1f}s", True, (220, 220, 220))
-        hint = font.render("Drag or Arrows+Enter/Space to draw", True, (200, 200, 210))
+        level_label = render_text(font, f"Level {self.current_level + 1}/{len(self.levels)}", (230, 230, 230))
+        time_label = render_text(font, f"Time: {self.elapsed:0.1f}s", (220, 220, 220))
+        hint = render_text(font, "Drag or Arrows+Enter/Space to draw", (200, 200, 210))
         surface.blit(level_label, (self.bounds.left + 10, self.bounds.top + 8))
         surface.blit(time_label, (self.bounds.left + 10, self.bounds.top + 32))
         surface.blit(hint, (self.bounds.left + 10, self.bounds.bottom - 26))
@@ -4,38 +4,129 @@ Includes: Game Loop Manager, InputHandler, Player classes, collision, timer/scor
 scene management (menu → game → results) and TAG game implementation.
 """
 from __future__ import annotations
+import atexit
+import importlib
 import os
 import sys
 import json
-from typing import List, Any
+import tempfile
+import time
+from functools import partial
+from typing import TYPE_CHECKING, List, Any
 import random
 import pygame
 
 from core.input_handler import InputHandler
+from core.text_cache import Text, cached_text
 from entities.player import Player, HumanPlayer, BotPlayer
-from games.tag import TagGame
-from games.survival import SurvivalGame, SurvivalPvpGame
-from games.snake import SnakeGame
-from games.control_zone import ControlZoneGame
-from games.trail_lock import TrailLockGame
-from games.tictactoe import TicTacToeGame
-from games.sudoku import SudokuGame
-from games.tictactoe import TicTacToeGame
-from games.brick_breaker import BrickBreakerGame
-from games.simon_grid import SimonGridGame
-from games.maze_runner import MazeRunnerGame
-from games.whack_a_box import WhackABoxGame
-from games.box_stack import BoxStackGame
-from games.flappy_box import FlappyBoxGame
-from games.tetris_box import TetrisBoxGame
-from games.zip_box import ZipBoxGame
+
+# Game modules are imported by the launcher that needs them, so startup
+# only loads the menus.
+if TYPE_CHECKING:
+    from games.zip_box import ZipBoxGame
 
 # Window settings (upscaled for side-view platformer arenas)
 WIDTH, HEIGHT = 1280, 720
 BG_COLOR = (20, 20, 30)
 
+# Play areas handed to the games. Games only read their bounds, so every
+# launch shares one Rect instead of building its own.
+ARENA_BOUNDS = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
+WHACK_BOUNDS = pygame.Rect(40, 80, WIDTH - 80, HEIGHT - 140)
+FLAPPY_BOUNDS = pygame.Rect(80, 60, WIDTH - 160, HEIGHT - 120)
+# Slight margins so the 10x20 Tetris grid and side HUD fit cleanly
+TETRIS_BOUNDS = pygame.Rect(60, 40, WIDTH - 120, HEIGHT - 80)
+# Central board area for the numbered-grid puzzle
+ZIP_BOUNDS = pygame.Rect(60, 60, WIDTH - 120, HEIGHT - 120)
+STACK_BOUNDS = pygame.Rect(120, 80, WIDTH - 240, HEIGHT - 140)
+# Square-ish board area centered with top HUD room
+SIMON_BOUNDS = pygame.Rect(140, 80, WIDTH - 280, HEIGHT - 160)
+MAZE_BOUNDS = pygame.Rect(40, 60, WIDTH - 80, HEIGHT - 120)
+# Centered board with margin for HUD
+SUDOKU_BOUNDS = pygame.Rect(100, 60, WIDTH - 200, HEIGHT - 120)
+TTT_BOUNDS = pygame.Rect(120, 100, WIDTH - 240, HEIGHT - 200)
+TTT_PVP_NAMES = ("P1", "P2")
+
+# Solo games that start from just their bounds: key -> (module, class,
+# bounds, extra constructor kwargs). Modules are imported on first launch.
+GAME_REGISTRY: dict[str, tuple[str, str, pygame.Rect, dict[str, Any]]] = {
+    "snake": ("games.snake", "SnakeGame", ARENA_BOUNDS, {}),
+    "brick_breaker": ("games.brick_breaker", "BrickBreakerGame", ARENA_BOUNDS, {}),
+    "whack_a_box": ("games.whack_a_box", "WhackABoxGame", WHACK_BOUNDS, {"round_duration": 30.0}),
+    "flappy_box": ("games.flappy_box", "FlappyBoxGame", FLAPPY_BOUNDS, {}),
+    "tetris_box": ("games.tetris_box", "TetrisBoxGame", TETRIS_BOUNDS, {}),
+    "box_stack": ("games.box_stack", "BoxStackGame", STACK_BOUNDS, {}),
+    "simon_grid": ("games.simon_grid", "SimonGridGame", SIMON_BOUNDS, {"grid_size": 3}),
+    "maze_runner": ("games.maze_runner", "MazeRunnerGame", MAZE_BOUNDS, {}),
+}
+
+# Tag arena and its spawn grid, indexed by join order (humans, then bots)
+TAG_BOUNDS = ARENA_BOUNDS
+TAG_SPAWNS = (
+    (TAG_BOUNDS.left + 40, TAG_BOUNDS.top + 40),
+    (TAG_BOUNDS.right - 80, TAG_BOUNDS.top + 40),
+    (TAG_BOUNDS.left + 40, TAG_BOUNDS.bottom - 80),
+    (TAG_BOUNDS.right - 80, TAG_BOUNDS.bottom - 80),
+    (TAG_BOUNDS.centerx - 40, TAG_BOUNDS.centery - 40),
+    (TAG_BOUNDS.centerx + 40, TAG_BOUNDS.centery - 40),
+    (TAG_BOUNDS.centerx - 40, TAG_BOUNDS.centery + 40),
+    (TAG_BOUNDS.centerx + 40, TAG_BOUNDS.centery + 40),
+)
+
+# Card selector grid: region between title and footer, and card spacing
+CARD_MARGIN_X = 80
+CARD_MARGIN_TOP = 140
+CARD_MARGIN_BOTTOM = 90
+CARD_GAP = 22
+
+# Simulation timestep and the most catch-up steps run in a single frame.
+# The loop keeps time in integer nanoseconds; FIXED_DT is what update() gets.
+FIXED_DT_NS = 1_000_000_000 // 60
+FIXED_DT = FIXED_DT_NS / 1e9
+MAX_STEPS_PER_FRAME = 5
+# Frame pacing target for animated scenes
+FRAME_TIME_NS = 1_000_000_000 // 60
+
+# Longest a static scene sleeps waiting for input before redrawing
+IDLE_WAIT_MS = 50
+
+# Event types any scene or the input handler reacts to; SDL drops the rest
+_ALLOWED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.WINDOWEXPOSED,
+)
+
+# Navigation key groups, built once instead of a tuple per key press.
+# Vertical lists treat A/D like W/S; grids and the Controls table use
+# each direction on its own.
+_KEYS_PREV = frozenset((pygame.K_UP, pygame.K_w, pygame.K_a))
+_KEYS_NEXT = frozenset((pygame.K_DOWN, pygame.K_s, pygame.K_d))
+_KEYS_LEFT = frozenset((pygame.K_LEFT, pygame.K_a))
+_KEYS_RIGHT = frozenset((pygame.K_RIGHT, pygame.K_d))
+_KEYS_UP = frozenset((pygame.K_UP, pygame.K_w))
+_KEYS_DOWN = frozenset((pygame.K_DOWN, pygame.K_s))
+_KEYS_CONFIRM = frozenset((pygame.K_RETURN, pygame.K_SPACE))
+
+# Keycode -> binding name written to keybindings.json by ControlsScene.
+# Letters (either case), arrows and keypad digits use K_* names; anything
+# else falls back to pygame.key.name().
+_KEYCODE_NAMES: dict[int, str] = {
+    **{ord(c): f"K_{c.upper()}" for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+    pygame.K_UP: "K_UP",
+    pygame.K_DOWN: "K_DOWN",
+    pygame.K_LEFT: "K_LEFT",
+    pygame.K_RIGHT: "K_RIGHT",
+    **{getattr(pygame, f"K_KP{i}"): f"K_KP{i}" for i in range(10)},
+}
+
 # Player colors (distinct boxes)
-PLAYER_COLORS = [
+PLAYER_COLORS = (
     (240, 84, 84),   # red
     (84, 160, 240),  # blue
     (84, 240, 120),  # green
@@ -44,17 +135,198 @@ PLAYER_COLORS = [
     (84, 240, 220),  # cyan
     (240, 140, 140), # salmon
     (140, 240, 140), # light green
-]
+)
+
+# (player_id, name, color) for each join slot, built once for the launchers
+PLAYER_SLOTS = tuple((i + 1, f"P{i+1}", color) for i, color in enumerate(PLAYER_COLORS))
+
+
+_FONT_CACHE: dict[tuple[str, int], pygame.font.Font] = {}
+
+
+def _sysfont(name: str, size: int) -> pygame.font.Font:
+    """Open a system font once per (name, size) and share it.
+
+    SysFont looks the family up and opens the TTF on every call. Sharing
+    the Font object also lets cached_text() hits carry across scenes.
+    """
+    key = (name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.SysFont(name, size)
+    return font
+
+
+def _sleep_until(deadline_ns: int, precise: bool = True) -> None:
+    """Wait until perf_counter_ns() reaches deadline_ns.
+
+    time.sleep() can overshoot by a millisecond or more, so when precise is
+    set sleep for all but the last millisecond and spin for the remainder.
+    Otherwise just sleep and accept the overshoot instead of burning CPU.
+    """
+    remaining = deadline_ns - time.perf_counter_ns()
+    if not precise:
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+        return
+    if remaining > 2_000_000:
+        time.sleep((remaining - 1_000_000) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+
+def _grid_hit(pos: tuple[int, int], grid: tuple[int, int, int, int, int, int], cols: int, count: int) -> int:
+    """Return the index of the grid cell under pos, or -1 for gaps/outside.
+
+    grid is (left, top, cell_w, cell_h, pitch_x, pitch_y) for cells laid
+    out row-major, so the cell comes from two divisions rather than a
+    collidepoint scan over every rect.
+    """
+    left, top, cell_w, cell_h, pitch_x, pitch_y = grid
+    dx = pos[0] - left
+    dy = pos[1] - top
+    if dx < 0 or dy < 0:
+        return -1
+    col, off_x = divmod(dx, pitch_x)
+    row, off_y = divmod(dy, pitch_y)
+    if col >= cols or off_x >= cell_w or off_y >= cell_h:
+        return -1
+    index = row * cols + col
+    return index if index < count else -1
+
+
+def _card_grid(count: int, cols: int) -> tuple[tuple[int, int, int, int, int, int] | None, list[pygame.Rect]]:
+    """Lay out count cards in cols columns centered in the card region.
+
+    Returns the (left, top, card_w, card_h, pitch_x, pitch_y) grid used by
+    _grid_hit() and the card rects in row-major order.
+    """
+    rows = (count + cols - 1) // cols
+    if rows <= 0:
+        return None, []
+    region_w = WIDTH - 2 * CARD_MARGIN_X
+    region_h = HEIGHT - CARD_MARGIN_TOP - CARD_MARGIN_BOTTOM
+    card_w = (region_w - CARD_GAP * (cols - 1)) // cols
+    card_h = (region_h - CARD_GAP * (rows - 1)) // rows
+
+    total_w = cols * card_w + (cols - 1) * CARD_GAP
+    total_h = rows * card_h + (rows - 1) * CARD_GAP
+    left = CARD_MARGIN_X + (region_w - total_w) // 2
+    top = CARD_MARGIN_TOP + (region_h - total_h) // 2
+
+    pitch_x = card_w + CARD_GAP
+    pitch_y = card_h + CARD_GAP
+    Rect = pygame.Rect
+    rects = [
+        Rect(left + (i % cols) * pitch_x, top + (i // cols) * pitch_y, card_w, card_h)
+        for i in range(count)
+    ]
+    return (left, top, card_w, card_h, pitch_x, pitch_y), rects
+
+
+_FIT_CACHE: dict[tuple[pygame.font.Font, str, int], str] = {}
+
+
+def _fit_text(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """Trim text with ellipsis so it fits within max_width pixels.
+
+    Widths come from font.size(), so no Surfaces are rendered just to be
+    measured, and the cut point is found by binary search. Results are
+    memoized per (font, text, max_width).
+    """
+    key = (font, text, max_width)
+    fitted = _FIT_CACHE.get(key)
+    if fitted is not None:
+        return fitted
+    if not text or font.size(text)[0] <= max_width:
+        fitted = text
+    else:
+        ellipsis = "..."
+        # Longest prefix whose width with the ellipsis still fits
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if font.size(text[:mid] + ellipsis)[0] <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        fitted = text[:lo] + ellipsis
+    _FIT_CACHE[key] = fitted
+    return fitted
+
+
+_BOX_CACHE: dict[tuple, pygame.Surface] = {}
+
+
+def _info_box(size: tuple[int, int], fill: tuple[int, int, int], border: tuple[int, int, int],
+              swatch: pygame.Rect | None = None, swatch_color: tuple[int, int, int] | None = None) -> pygame.Surface:
+    """Compose a bordered box, optionally with a color swatch, once and reuse it.
+
+    swatch is relative to the box. Rows then cost a single blit, which lets
+    callers hand the whole screen to Surface.blits() in one call.
+    """
+    key = (size, fill, border, swatch and tuple(swatch), swatch_color)
+    box = _BOX_CACHE.get(key)
+    if box is None:
+        box = pygame.Surface(size).convert()
+        box_rect = box.get_rect()
+        pygame.draw.rect(box, fill, box_rect)
+        pygame.draw.rect(box, border, box_rect, 2)
+        if swatch is not None:
+            pygame.draw.rect(box, swatch_color, swatch)
+        _BOX_CACHE[key] = box
+    return box
+
+
+def _make_players(count: int, size: int, speed: float,
+                  spawns: tuple[tuple[int, int], ...] | None = None) -> list[HumanPlayer]:
+    """Build human players P1..Pn in the standard colors.
+
+    With spawns the players start on those points in turn; otherwise they
+    start at the origin and the game's reset() places them.
+    """
+    spawns = spawns or ((0, 0),)
+    return [
+        HumanPlayer(pid, name, pygame.Rect(spawns[i % len(spawns)], (size, size)), color, speed, True)
+        for i, (pid, name, color) in enumerate(PLAYER_SLOTS[:count])
+    ]
 
 
 class Scene:
+    # No per-instance dict here, so subclasses may opt into __slots__
+    __slots__ = ()
+
+    # Scenes that only change in response to input set this to False so
+    # the main loop can sleep until the next event instead of ticking.
+    needs_animation = True
+    # Gameplay scenes spin for the last millisecond of each frame to hit
+    # the deadline exactly; others just sleep.
+    precise_timing = False
+    # Only scenes that track drags get MOUSEMOTION events; for the rest
+    # App.run polls the cursor once per frame and calls hover() on change.
+    wants_mouse_motion = False
+    # Set while update() has nothing to do; the main loop then skips it
+    paused = False
+
     def handle_event(self, event: pygame.event.Event):
         pass
 
+    def hover(self, pos: tuple[int, int]):
+        pass
+
     def update(self, dt: float):
         pass
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        """Draw the scene.
+
+        Return None when the whole surface may have changed, or the list of
+        rects that were repainted (empty if nothing changed).
+        """
+        return None
+
+    def invalidate(self):
+        """Forget what is on screen so the next draw repaints everything."""
         pass
 
 
@@ -63,10 +335,25 @@ class SceneManager:
         self.current = initial
 
     def set(self, scene: Scene):
+        # The screen still shows the previous scene
+        scene.invalidate()
         self.current = scene
 
 
 class LobbyState:
+    # Fixed set of fields; slots keep lookups off a per-instance dict and
+    # turn a mistyped setting name into an AttributeError.
+    __slots__ = (
+        "mode",
+        "game",
+        "num_players",
+        "tag_double_jump",
+        "tag_map_index",
+        "tag_enable_moving",
+        "tag_enable_dropthrough",
+        "tag_enable_speed",
+    )
+
     def __init__(self):
         self.mode: str | None = None  # 'pvp' or 'single'
         self.game: str | None = None  # e.g., 'tag'
@@ -86,6 +373,18 @@ class BaseMenuScene(Scene):
     Draws centered boxes for items and highlights the selected one.
     """
 
+    # Every subclass declares its own slots too, so menu scenes carry no
+    # per-instance dict
+    __slots__ = (
+        "app", "title", "items", "selected", "font", "big_font", "_title",
+        "_hint", "_layout_cache", "_layout_n", "box_w", "box_h", "box_gap",
+        "box_color", "box_highlight", "box_outline", "_bg", "_bg_items",
+        "_item_surfs", "_drawn", "_partial_draw", "_handlers",
+    )
+
+    needs_animation = False
+    paused = True
+
     def __init__(self, app: "App", title: str, items: list[str]):
         self.app = app
         self.title = title
@@ -93,6 +392,11 @@ class BaseMenuScene(Scene):
         self.selected = 0
         self.font = app.font
         self.big_font = app.big_font
+        # Title and footer hint never change for a given menu
+        self._title = cached_text(self.big_font, title, (255, 255, 255))
+        self._hint = cached_text(self.font, "Up/Down: Navigate  Enter: Select  Esc: Back", (180, 180, 180))
+        self._layout_cache: tuple | None = None
+        self._layout_n = -1
 
         # Box layout
         self.box_w = 420
@@ -102,54 +406,80 @@ class BaseMenuScene(Scene):
         self.box_highlight = (120, 120, 180)
         self.box_outline = (180, 180, 220)
 
+        # Pre-rendered backdrop: fill, title, unselected boxes and hint.
+        # Rebuilt only when the item labels change.
+        self._bg: pygame.Surface | None = None
+        self._bg_items: tuple[str, ...] = ()
+        self._item_surfs: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+        # (backdrop, selected index) currently on screen; None forces a
+        # full repaint. Subclasses that override draw() always repaint;
+        # extra static content goes in an overridden _background().
+        self._drawn: tuple[pygame.Surface, int] | None = None
+        self._partial_draw = type(self).draw is BaseMenuScene.draw
+
+        # One dict lookup per event instead of an if/elif chain
+        self._handlers = {
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+        }
+
     def handle_event(self, event: pygame.event.Event):
-        if event.type == pygame.KEYDOWN:
-            if not self.items:
-                return
-            # Support arrows and WASD/AD-style navigation
-            if event.key in (pygame.K_UP, pygame.K_w, pygame.K_a):
-                self.selected = (self.selected - 1) % len(self.items)
-            elif event.key in (pygame.K_DOWN, pygame.K_s, pygame.K_d):
-                self.selected = (self.selected + 1) % len(self.items)
-            elif event.key == pygame.K_RETURN:
-                self.handle_select(self.selected)
-            elif event.key == pygame.K_ESCAPE:
-                self.handle_back()
-        elif event.type == pygame.MOUSEMOTION:
-            # Hover to change selection
-            if not self.items:
-                return
-            rects, _, _, _, _ = self._layout()
-            mx, my = event.pos
-            for i, r in enumerate(rects):
-                if r.collidepoint(mx, my):
-                    self.selected = i
-                    break
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Click to activate
-            if not self.items:
-                return
-            rects, _, _, _, _ = self._layout()
-            mx, my = event.pos
-            for i, r in enumerate(rects):
-                if r.collidepoint(mx, my):
-                    self.selected = i
-                    self.handle_select(i)
-                    break
-        elif event.type == pygame.MOUSEWHEEL:
-            if not self.items:
-                return
-            if event.y > 0:
-                self.selected = (self.selected - 1) % len(self.items)
-            elif event.y < 0:
-                self.selected = (self.selected + 1) % len(self.items)
+        if not self.items:
+            return
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _on_keydown(self, event: pygame.event.Event):
+        # Support arrows and WASD/AD-style navigation
+        if event.key in _KEYS_PREV:
+            self.selected = (self.selected - 1) % len(self.items)
+        elif event.key in _KEYS_NEXT:
+            self.selected = (self.selected + 1) % len(self.items)
+        elif event.key == pygame.K_RETURN:
+            self.handle_select(self.selected)
+        elif event.key == pygame.K_ESCAPE:
+            self.handle_back()
+
+    def _item_at(self, pos: tuple[int, int]) -> int:
+        """Index of the menu box under pos, or -1."""
+        rects, _, _, _, _ = self._layout()
+        if not rects:
+            return -1
+        first = rects[0]
+        grid = (first.left, first.top, first.width, first.height, first.width, self.box_h + self.box_gap)
+        return _grid_hit(pos, grid, 1, len(rects))
+
+    def hover(self, pos: tuple[int, int]):
+        # Hover to change selection
+        if not self.items:
+            return
+        i = self._item_at(pos)
+        if i >= 0:
+            self.selected = i
+
+    def _on_mouse_down(self, event: pygame.event.Event):
+        # Click to activate
+        if event.button != 1:
+            return
+        i = self._item_at(event.pos)
+        if i >= 0:
+            self.selected = i
+            self.handle_select(i)
+
+    def _on_mouse_wheel(self, event: pygame.event.Event):
+        if event.y > 0:
+            self.selected = (self.selected - 1) % len(self.items)
+        elif event.y < 0:
+            self.selected = (self.selected + 1) % len(self.items)
 
     def handle_select(self, index: int):
         pass
 
     def handle_back(self):
         # Default: go to Home
-        self.app.scene_manager.set(HomeScene(self.app))
+        self.app.go(HomeScene)
 
     def update(self, dt: float):
         pass
@@ -165,24 +495,32 @@ class BaseMenuScene(Scene):
         return rects
 
     def _layout(self):
-        """Compute menu rects and shared title/footer layout.
+        """Return menu rects and shared title/footer layout.
 
         Returns (rects, title_surf, title_pos, hint_surf, hint_pos).
         Used by both draw and mouse hit-testing to keep geometry in sync.
+        Geometry only depends on the item count, so it is cached per count.
         """
+        n = len(self.items)
+        if self._layout_cache is None or self._layout_n != n:
+            self._layout_cache = self._compute_layout()
+            self._layout_n = n
+        return self._layout_cache
+
+    def _compute_layout(self):
         rects = self._menu_rects()
 
-        title = self.big_font.render(self.title, True, (255, 255, 255))
+        title = self._title
         title_y = 90
-        title_pos = (WIDTH // 2 - title.get_width() // 2, title_y)
+        title_pos = (WIDTH // 2 - title.w // 2, title_y)
 
-        hint = self.font.render("Up/Down: Navigate  Enter: Select  Esc: Back", True, (180, 180, 180))
+        hint = self._hint
         hint_y = HEIGHT - 60
-        hint_pos = (WIDTH // 2 - hint.get_width() // 2, hint_y)
+        hint_pos = (WIDTH // 2 - hint.w // 2, hint_y)
 
         # Ensure menu doesn't overlap the title/footer
         if rects:
-            min_start = title_y + title.get_height() + 30
+            min_start = title_y + title.h + 30
             dy_down = max(0, min_start - rects[0].top)
             if dy_down > 0:
                 rects = [r.move(0, dy_down) for r in rects]
@@ -194,69 +532,129 @@ class BaseMenuScene(Scene):
                 if dy_down > 0:
                     rects = [r.move(0, dy_down) for r in rects]
 
-        return rects, title, title_pos, hint, hint_pos
-
-    def draw(self, surface: pygame.Surface):
-        surface.fill(BG_COLOR)
+        return rects, title.surf, title_pos, hint.surf, hint_pos
+
+    def _draw_item(self, surface: pygame.Surface, rect: pygame.Rect, label: str, fill: tuple[int, int, int]):
+        # Boxes are composed once per (label, fill) and then just blitted
+        key = (label, fill)
+        box = self._item_surfs.get(key)
+        if box is None:
+            box = pygame.Surface(rect.size).convert()
+            box_rect = box.get_rect()
+            pygame.draw.rect(box, fill, box_rect)
+            pygame.draw.rect(box, self.box_outline, box_rect, 2)
+            text = cached_text(self.font, label, (240, 240, 240))
+            box.blit(text.surf, text.centered(box_rect.centerx, box_rect.centery))
+            self._item_surfs[key] = box
+        surface.blit(box, rect)
+
+    def _background(self, rects: list[pygame.Rect], title: pygame.Surface, title_pos, hint: pygame.Surface, hint_pos) -> pygame.Surface:
+        items = tuple(self.items)
+        if self._bg is None or self._bg_items != items:
+            bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+            bg.fill(BG_COLOR)
+            bg.blit(title, title_pos)
+            for rect, label in zip(rects, items):
+                self._draw_item(bg, rect, label, self.box_color)
+            bg.blit(hint, hint_pos)
+            self._bg = bg
+            self._bg_items = items
+        return self._bg
+
+    def invalidate(self):
+        self._drawn = None
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
         rects, title, title_pos, hint, hint_pos = self._layout()
-
-        # Title
-        surface.blit(title, title_pos)
-        for i, rect in enumerate(rects):
-            is_sel = (i == self.selected)
-            fill = self.box_highlight if is_sel else self.box_color
-            pygame.draw.rect(surface, fill, rect)
-            pygame.draw.rect(surface, self.box_outline, rect, 2)
-
-            label = self.items[i]
-            surf = self.font.render(label, True, (240, 240, 240))
-            surface.blit(surf, (rect.centerx - surf.get_width()//2, rect.centery - surf.get_height()//2))
-        surface.blit(hint, hint_pos)
+        bg = self._background(rects, title, title_pos, hint, hint_pos)
+        selected = self.selected if 0 <= self.selected < len(rects) else -1
+        drawn = self._drawn
+        self._drawn = (bg, selected) if self._partial_draw else None
+
+        if drawn is None or drawn[0] is not bg:
+            surface.blit(bg, (0, 0))
+            # Only the selected box differs from the cached backdrop
+            if selected >= 0:
+                self._draw_item(surface, rects[selected], self.items[selected], self.box_highlight)
+            return None
+
+        # Same backdrop on screen: repaint just the boxes whose state changed
+        prev = drawn[1]
+        if prev == selected:
+            return []
+        dirty = []
+        if prev >= 0:
+            surface.blit(bg, rects[prev], rects[prev])
+            dirty.append(rects[prev])
+        if selected >= 0:
+            self._draw_item(surface, rects[selected], self.items[selected], self.box_highlight)
+            dirty.append(rects[selected])
+        return dirty
 
 
 class HomeScene(BaseMenuScene):
+    __slots__ = ("_status_key", "_actions")
+
     def __init__(self, app: "App"):
         items = ["Play", "Controls", "Quit"]
         super().__init__(app, "BOX ARCADE", items)
+        # Lobby (mode, game) shown in the cached backdrop's status line
+        self._status_key: tuple[str | None, str | None] | None = None
+        # Label -> action; one lookup instead of comparing labels
+        self._actions = {
+            "Play": lambda: app.go(ModeSelectScene),
+            "Controls": lambda: app.go(ControlsScene),
+            "Quit": self.handle_back,
+        }
 
-    def draw(self, surface: pygame.Surface):
-        super().draw(surface)
-        # Show current selections
-        mode = self.app.lobby.mode or "(none)"
-        game = self.app.lobby.game or "(none)"
-        status = self.font.render(f"Mode: {mode}   Game: {game}", True, (200, 200, 200))
-        surface.blit(status, (WIDTH//2 - status.get_width()//2, 150))
+    def _background(self, *layout) -> pygame.Surface:
+        # The status line shows the current selections; it is part of the
+        # backdrop, which is rebuilt only when the lobby changed
+        lobby = self.app.lobby
+        key = (lobby.mode, lobby.game)
+        if key != self._status_key:
+            self._bg = None
+            self._status_key = key
+        old = self._bg
+        bg = super()._background(*layout)
+        if bg is not old:
+            mode = lobby.mode or "(none)"
+            game = lobby.game or "(none)"
+            status = cached_text(self.font, f"Mode: {mode}   Game: {game}", (200, 200, 200))
+            bg.blit(status.surf, (WIDTH//2 - status.w//2, 150))
+        return bg
 
     def handle_select(self, index: int):
-        if self.items[index] == "Play":
-            self.app.scene_manager.set(ModeSelectScene(self.app))
-        elif self.items[index] == "Controls":
-            self.app.scene_manager.set(ControlsScene(self.app))
-        elif self.items[index] == "Quit":
-            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        action = self._actions.get(self.items[index])
+        if action is not None:
+            action()
 
     def handle_back(self):
-        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self.app.running = False
 
 
 class ModeSelectScene(BaseMenuScene):
+    __slots__ = ("_modes",)
+
     def __init__(self, app: "App"):
         items = ["Single Player", "PvP (Local)"]
         super().__init__(app, "Mode Select", items)
+        # Label -> (lobby mode, card-based game selector for that mode)
+        self._modes = {
+            "Single Player": ("single", SinglePlayerGameSelectScene),
+            "PvP (Local)": ("pvp", PvpGameSelectScene),
+        }
 
     def handle_select(self, index: int):
-        label = self.items[index]
-        if label.startswith("Single"):
-            self.app.lobby.mode = "single"
-            # Use dedicated card-based selector for single player games
-            self.app.scene_manager.set(SinglePlayerGameSelectScene(self.app))
-        elif label.startswith("PvP"):
-            self.app.lobby.mode = "pvp"
-            # Use card-based selector for PvP games as well
-            self.app.scene_manager.set(PvpGameSelectScene(self.app))
+        mode = self._modes.get(self.items[index])
+        if mode is not None:
+            self.app.lobby.mode, scene_cls = mode
+            self.app.go(scene_cls)
 
 
 class GameSelectScene(BaseMenuScene):
+    __slots__ = ("_games",)
+
     def __init__(self, app: "App"):
         mode = app.lobby.mode or "single"
         # This menu is now used only for PvP selection; single-player
@@ -265,114 +663,90 @@ class GameSelectScene(BaseMenuScene):
             mode = "pvp"
         items = ["Tag (Boxes)", "Survival (PvP)", "Control Zone", "TrailLock", "Tic Tac Toe", "Back"]
         super().__init__(app, "PvP Game Select", items)
+        # Menu label -> lobby game id
+        self._games = {
+            "Tag (Boxes)": "tag",
+            "Survival (PvP)": "survival_pvp",
+            "Control Zone": "control_zone",
+            "TrailLock": "trail_lock",
+            "Tic Tac Toe": "ttt_pvp",
+        }
 
     def handle_select(self, index: int):
         label = self.items[index]
         mode = self.app.lobby.mode or "single"
         if label == "Back":
-            self.app.scene_manager.set(ModeSelectScene(self.app))
+            self.app.go(ModeSelectScene)
             return
-        if mode == "pvp" and label.startswith("Tag"):
-            self.app.lobby.game = "tag"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif mode == "pvp" and label.startswith("Survival"):
-            self.app.lobby.game = "survival_pvp"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif mode == "pvp" and label.startswith("Control Zone"):
-            self.app.lobby.game = "control_zone"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif mode == "pvp" and label.startswith("TrailLock"):
-            self.app.lobby.game = "trail_lock"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif mode == "pvp" and label.startswith("Tic Tac Toe"):
-            self.app.lobby.game = "ttt_pvp"
+        game = self._games.get(label) if mode == "pvp" else None
+        if game == "ttt_pvp":
+            self.app.lobby.game = game
             self.app.launch_ttt_pvp()
+        elif game is not None:
+            self.app.lobby.game = game
+            self.app.go(PlayerSetupScene)
 
 
-class PvpGameSelectScene(Scene):
-    """Card-based selector for local PvP games.
+class _CardGridScene(Scene):
+    """Shared card-grid selector behind the PvP and single-player pickers.
 
-    Mirrors the single-player card layout but launches PvP modes.
+    Displays fixed-size game cards in a grid with keyboard and mouse
+    navigation and a smooth-moving highlight frame. Subclasses supply the
+    title, the cards and the detail scene class opened by ``_activate``.
     """
 
-    def __init__(self, app: "App"):
+    # The pickers themselves only pass different cards and add no slots
+    __slots__ = (
+        "app", "font", "big_font", "card_font", "_title", "_hint", "card_color",
+        "card_hover", "card_outline", "_card_surfs", "_bg", "_drawn", "cards",
+        "cols", "detail", "selected_index", "card_rects", "highlight_center",
+        "_frame_surf", "_grid",
+    )
+
+    def __init__(self, app: "App", title: str, cards: list[dict[str, Any]], cols: int, detail: type):
         self.app = app
         self.font = app.font
         self.big_font = app.big_font
-        self.card_font = pygame.font.SysFont("consolas", 18)
-
-        # Available PvP games with short descriptions.
-        self.cards: list[dict[str, Any]] = [
-            {"id": "tag", "title": "Tag (Boxes)", "desc": "Side-view tag arena.", "mode": "PvP"},
-            {"id": "survival_pvp", "title": "Survival (PvP)", "desc": "Last box standing wins.", "mode": "PvP"},
-            {"id": "control_zone", "title": "Control Zone", "desc": "Hold the zone to score.", "mode": "PvP"},
-            {"id": "trail_lock", "title": "TrailLock", "desc": "Box Tron-style trails.", "mode": "PvP"},
-            {"id": "ttt_pvp", "title": "Tic Tac Toe (PvP)", "desc": "Classic 2-player grid.", "mode": "PvP"},
-        ]
-
-        # Use two columns and center the grid within the view
-        self.cols = 2
+        # Slightly smaller font for card content so text fits cleanly.
+        self.card_font = _sysfont("consolas", 18)
+        # Title and footer never change; cards are composed once each
+        self._title = cached_text(self.big_font, title, (255, 255, 255))
+        self._hint = cached_text(self.font, "Arrows/Mouse: Select  Enter/Click: Start  Esc: Back", (180, 180, 180))
+        self.card_color = (50, 50, 80)
+        self.card_hover = (90, 90, 140)
+        self.card_outline = (180, 180, 230)
+        self._card_surfs: dict[tuple[int, tuple[int, int, int]], pygame.Surface] = {}
+        self._bg: pygame.Surface | None = None
+        # (selected index, highlight frame) currently on screen; None
+        # forces a full repaint
+        self._drawn: tuple[int, pygame.Rect | None] | None = None
+
+        self.cards = cards
+        self.cols = cols
+        # Scene class built as detail(app, card) when a card is chosen
+        self.detail = detail
         self.selected_index = 0
         self.card_rects: list[pygame.Rect] = []
         self._build_layout()
 
+        # Highlight frame center for smooth movement
         if self.card_rects:
             cx, cy = self.card_rects[0].center
         else:
             cx, cy = WIDTH // 2, HEIGHT // 2
         self.highlight_center = [float(cx), float(cy)]
+        self._frame_surf: pygame.Surface | None = None
+        if self.card_rects:
+            card = self.card_rects[0]
+            self._frame_surf = self._highlight_frame((card.width + 16, card.height + 16))
 
     def _build_layout(self):
-        # Grid region between title and footer
-        margin_x = 80
-        margin_top = 140
-        margin_bottom = 90
-        region = pygame.Rect(
-            margin_x,
-            margin_top,
-            WIDTH - 2 * margin_x,
-            HEIGHT - margin_top - margin_bottom,
-        )
-        gap_x = 22
-        gap_y = 22
-
-        rows = (len(self.cards) + self.cols - 1) // self.cols
-        if rows <= 0:
-            self.card_rects = []
-            return
-
-        card_w = (region.width - gap_x * (self.cols - 1)) // self.cols
-        card_h = (region.height - gap_y * (rows - 1)) // rows
-
-        total_w = self.cols * card_w + (self.cols - 1) * gap_x
-        total_h = rows * card_h + (rows - 1) * gap_y
-        offset_x = region.left + (region.width - total_w) // 2
-        offset_y = region.top + (region.height - total_h) // 2
-
-        self.card_rects.clear()
-        for i, _ in enumerate(self.cards):
-            row = i // self.cols
-            col = i % self.cols
-            x = offset_x + col * (card_w + gap_x)
-            y = offset_y + row * (card_h + gap_y)
-            self.card_rects.append(pygame.Rect(x, y, card_w, card_h))
-
-    def _fit_text(self, text: str, max_width: int) -> str:
-        if not text:
-            return text
-        surf = self.card_font.render(text, True, (0, 0, 0))
-        if surf.get_width() <= max_width:
-            return text
-        ellipsis = "..."
-        trimmed = text
-        while trimmed and self.card_font.render(trimmed + ellipsis, True, (0, 0, 0)).get_width() > max_width:
-            trimmed = trimmed[:-1]
-        return trimmed + ellipsis if trimmed else ellipsis
+        self._grid, self.card_rects = _card_grid(len(self.cards), self.cols)
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.app.scene_manager.set(ModeSelectScene(self.app))
+                self.app.go(ModeSelectScene)
                 return
             if not self.card_rects:
                 return
@@ -380,35 +754,28 @@ class PvpGameSelectScene(Scene):
             idx = self.selected_index
             row = idx // cols
             col = idx % cols
-            if event.key in (pygame.K_LEFT, pygame.K_a):
+            if event.key in _KEYS_LEFT:
                 if col > 0:
                     idx -= 1
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
+            elif event.key in _KEYS_RIGHT:
                 if col < cols - 1 and idx + 1 < len(self.cards):
                     idx += 1
-            elif event.key in (pygame.K_UP, pygame.K_w):
+            elif event.key in _KEYS_UP:
                 if row > 0:
                     idx -= cols
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
+            elif event.key in _KEYS_DOWN:
                 if idx + cols < len(self.cards):
                     idx += cols
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _KEYS_CONFIRM:
                 self._activate(self.selected_index)
             self.selected_index = max(0, min(idx, len(self.cards) - 1))
-        elif event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-            for i, r in enumerate(self.card_rects):
-                if r.collidepoint(mx, my):
-                    self.selected_index = i
-                    break
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            for i, r in enumerate(self.card_rects):
-                if r.collidepoint(mx, my):
-                    self.selected_index = i
-                    self._activate(i)
-                    break
+            i = self._card_at(event.pos)
+            if i >= 0:
+                self.selected_index = i
+                self._activate(i)
         elif event.type == pygame.MOUSEWHEEL:
+            # Scroll up/down by rows
             if not self.card_rects:
                 return
             cols = self.cols
@@ -419,55 +786,142 @@ class PvpGameSelectScene(Scene):
                 idx += cols
             self.selected_index = idx
 
+    def _card_at(self, pos: tuple[int, int]) -> int:
+        if not self.card_rects:
+            return -1
+        return _grid_hit(pos, self._grid, self.cols, len(self.card_rects))
+
+    def hover(self, pos: tuple[int, int]):
+        i = self._card_at(pos)
+        if i >= 0:
+            self.selected_index = i
+
     def _activate(self, index: int):
         if index < 0 or index >= len(self.cards):
             return
-        card = self.cards[index]
-        # Step 2: go to PvP game detail page
-        self.app.scene_manager.set(PvpGameDetailScene(self.app, card))
+        # Step 2: go to the game's detail page
+        self.app.scene_manager.set(self.detail(self.app, self.cards[index]))
 
     def update(self, dt: float):
+        # Smoothly move highlight frame toward the selected card.
         if not self.card_rects or self.selected_index >= len(self.card_rects):
             return
-        target = self.card_rects[self.selected_index].center
+        tx, ty = self.card_rects[self.selected_index].center
+        hx, hy = self.highlight_center
+        if hx == tx and hy == ty:
+            return
         speed = 12.0
-        for i in (0, 1):
-            delta = target[i] - self.highlight_center[i]
-            self.highlight_center[i] += delta * min(1.0, speed * dt)
-
-    def draw(self, surface: pygame.Surface):
-        surface.fill(BG_COLOR)
-        title = self.big_font.render("PvP (Local)", True, (255, 255, 255))
-        title_y = 80
-        surface.blit(title, (WIDTH // 2 - title.get_width() // 2, title_y))
-
-        hint = self.font.render("Arrows/Mouse: Select  Enter/Click: Start  Esc: Back", True, (180, 180, 180))
-        hint_y = HEIGHT - 50
-        surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, hint_y))
-
-        base_col = (50, 50, 80)
-        hover_col = (90, 90, 140)
-        outline_col = (180, 180, 230)
-
-        for i, (card, rect) in enumerate(zip(self.cards, self.card_rects)):
-            is_sel = (i == self.selected_index)
-            fill = hover_col if is_sel else base_col
-            pygame.draw.rect(surface, fill, rect)
-            pygame.draw.rect(surface, outline_col, rect, 2)
+        k = min(1.0, speed * dt)
+        hx += (tx - hx) * k
+        hy += (ty - hy) * k
+        # Snap once within half a pixel so the frame settles exactly
+        if abs(tx - hx) < 0.5 and abs(ty - hy) < 0.5:
+            hx, hy = float(tx), float(ty)
+        self.highlight_center[0] = hx
+        self.highlight_center[1] = hy
+
+    def _card_surface(self, index: int, fill: tuple[int, int, int]) -> pygame.Surface:
+        """Compose a card (box, outline, fitted title) once per (index, fill)."""
+        key = (index, fill)
+        card_surf = self._card_surfs.get(key)
+        if card_surf is None:
+            rect = self.card_rects[index]
+            card_surf = pygame.Surface(rect.size).convert()
+            box = card_surf.get_rect()
+            pygame.draw.rect(card_surf, fill, box)
+            pygame.draw.rect(card_surf, self.card_outline, box, 2)
             # Compact card: only render game title centered in the box
-            max_text_w = rect.width - 24
-            title_text = self._fit_text(card["title"], max_text_w)
-            t_surf = self.card_font.render(title_text, True, (240, 240, 240))
-            t_x = rect.centerx - t_surf.get_width() // 2
-            t_y = rect.centery - t_surf.get_height() // 2
-            surface.blit(t_surf, (t_x, t_y))
-
+            max_text_w = rect.width - 24  # horizontal padding
+            title_text = _fit_text(self.card_font, self.cards[index]["title"], max_text_w)
+            t = cached_text(self.card_font, title_text, (240, 240, 240))
+            card_surf.blit(t.surf, t.centered(box.centerx, box.centery))
+            self._card_surfs[key] = card_surf
+        return card_surf
+
+    def _background(self) -> pygame.Surface:
+        """Pre-render the title, footer hint and every card unselected."""
+        bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        bg.fill(BG_COLOR)
+        title = self._title
+        bg.blit(title.surf, (WIDTH // 2 - title.w // 2, 80))
+        hint = self._hint
+        bg.blit(hint.surf, (WIDTH // 2 - hint.w // 2, HEIGHT - 50))
+        bg.blits([(self._card_surface(i, self.card_color), rect) for i, rect in enumerate(self.card_rects)], doreturn=False)
+        return bg
+
+    @staticmethod
+    def _highlight_frame(size: tuple[int, int]) -> pygame.Surface:
+        """Rasterize the 3px highlight outline once; it only ever moves."""
+        frame_surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        frame_surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(frame_surf, (230, 230, 255), frame_surf.get_rect(), 3)
+        return frame_surf
+
+    def invalidate(self):
+        self._drawn = None
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        if self._bg is None:
+            self._bg = self._background()
+        bg = self._bg
+        selected = self.selected_index if 0 <= self.selected_index < len(self.card_rects) else -1
+        # Highlight frame with smooth movement
+        frame = None
         if self.card_rects:
             hw = self.card_rects[0].width + 16
             hh = self.card_rects[0].height + 16
             frame = pygame.Rect(0, 0, hw, hh)
             frame.center = (int(self.highlight_center[0]), int(self.highlight_center[1]))
-            pygame.draw.rect(surface, (230, 230, 255), frame, 3)
+        drawn = self._drawn
+        self._drawn = (selected, frame)
+
+        if drawn is None:
+            surface.blit(bg, (0, 0))
+            dirty = None
+        else:
+            # Restore what moved from the backdrop, then repaint on top
+            prev, prev_frame = drawn
+            if prev == selected and prev_frame == frame:
+                return []
+            dirty = []
+            if prev_frame is not None:
+                surface.blit(bg, prev_frame, prev_frame)
+                dirty.append(prev_frame)
+            if prev >= 0 and prev != selected:
+                surface.blit(bg, self.card_rects[prev], self.card_rects[prev])
+                dirty.append(self.card_rects[prev])
+            if selected >= 0:
+                dirty.append(self.card_rects[selected])
+            if frame is not None:
+                dirty.append(frame)
+
+        # Only the selected card differs from the backdrop
+        if selected >= 0:
+            surface.blit(self._card_surface(selected, self.card_hover), self.card_rects[selected])
+        if frame is not None:
+            surface.blit(self._frame_surf, frame)
+        return dirty
+
+
+class PvpGameSelectScene(_CardGridScene):
+    """Card-based selector for local PvP games.
+
+    Mirrors the single-player card layout but launches PvP modes.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, app: "App"):
+        # Available PvP games with short descriptions.
+        cards = [
+            {"id": "tag", "title": "Tag (Boxes)", "desc": "Side-view tag arena.", "mode": "PvP"},
+            {"id": "survival_pvp", "title": "Survival (PvP)", "desc": "Last box standing wins.", "mode": "PvP"},
+            {"id": "control_zone", "title": "Control Zone", "desc": "Hold the zone to score.", "mode": "PvP"},
+            {"id": "trail_lock", "title": "TrailLock", "desc": "Box Tron-style trails.", "mode": "PvP"},
+            {"id": "ttt_pvp", "title": "Tic Tac Toe (PvP)", "desc": "Classic 2-player grid.", "mode": "PvP"},
+        ]
+        # Use two columns and center the grid within the view
+        super().__init__(app, "PvP (Local)", cards, cols=2, detail=PvpGameDetailScene)
 
 
 class PvpGameDetailScene(BaseMenuScene):
@@ -476,18 +930,24 @@ class PvpGameDetailScene(BaseMenuScene):
     Shows title, description, per-player controls, and Start/Back.
     """
 
+    __slots__ = ("card", "_starts", "_panel_rect", "_panel")
+
     def __init__(self, app: "App", card: dict[str, Any]):
         items = ["Start", "Back"]
         super().__init__(app, "PvP — Game", items)
         self.card = card
-
-    def _load_bindings(self) -> dict:
-        cfg_path = os.path.join(os.path.dirname(__file__), "keybindings.json")
-        try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {"players": {}}
+        # Card id -> how to start it; most PvP games pick a player count first
+        setup = lambda: app.go(PlayerSetupScene)
+        self._starts = {
+            "tag": setup,
+            "survival_pvp": setup,
+            "control_zone": setup,
+            "trail_lock": setup,
+            "ttt_pvp": app.launch_ttt_pvp,
+        }
+        self._panel_rect = pygame.Rect(0, 0, WIDTH - 200, 300)
+        self._panel_rect.center = (WIDTH // 2, HEIGHT // 2)
+        self._panel = self._panel_surface()
 
     def handle_select(self, index: int):
         label = self.items[index]
@@ -495,84 +955,69 @@ class PvpGameDetailScene(BaseMenuScene):
             self._start_game()
         elif label == "Back":
             # Return to the PvP grid
-            self.app.scene_manager.set(PvpGameSelectScene(self.app))
+            self.app.go(PvpGameSelectScene)
 
     def _start_game(self):
         cid = self.card.get("id", "")
         self.app.lobby.mode = "pvp"
-        if cid == "tag":
-            self.app.lobby.game = "tag"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif cid == "survival_pvp":
-            self.app.lobby.game = "survival_pvp"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif cid == "control_zone":
-            self.app.lobby.game = "control_zone"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif cid == "trail_lock":
-            self.app.lobby.game = "trail_lock"
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
-        elif cid == "ttt_pvp":
-            self.app.lobby.game = "ttt_pvp"
-            self.app.launch_ttt_pvp()
-
-    def draw(self, surface: pygame.Surface):
-        # Base menu draws title, Start/Back, and hint
-        super().draw(surface)
-
-        # Info panel box
-        panel_w = WIDTH - 200
-        panel_h = 300
-        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-        panel_rect.center = (WIDTH // 2, HEIGHT // 2)
-        pygame.draw.rect(surface, (40, 40, 70), panel_rect)
-        pygame.draw.rect(surface, (160, 160, 210), panel_rect, 2)
+        start = self._starts.get(cid)
+        if start is not None:
+            self.app.lobby.game = cid
+            start()
+
+    def _panel_surface(self) -> pygame.Surface:
+        """Compose the info panel (title, description, controls) once."""
+        panel = pygame.Surface(self._panel_rect.size).convert()
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, (40, 40, 70), panel_rect)
+        pygame.draw.rect(panel, (160, 160, 210), panel_rect, 2)
 
         title_text = self.card.get("title", "")
         desc_text = self.card.get("desc", "")
 
         y = panel_rect.top + 20
-        title_surf = self.big_font.render(title_text, True, (245, 245, 255))
-        surface.blit(title_surf, (panel_rect.centerx - title_surf.get_width() // 2, y))
-        y += title_surf.get_height() + 12
+        title_t = cached_text(self.big_font, title_text, (245, 245, 255))
+        panel.blit(title_t.surf, (panel_rect.centerx - title_t.w // 2, y))
+        y += title_t.h + 12
 
         if desc_text:
-            desc_surf = self.font.render(desc_text, True, (225, 225, 235))
-            surface.blit(desc_surf, (panel_rect.centerx - desc_surf.get_width() // 2, y))
-            y += desc_surf.get_height() + 18
+            desc_t = cached_text(self.font, desc_text, (225, 225, 235))
+            panel.blit(desc_t.surf, (panel_rect.centerx - desc_t.w // 2, y))
+            y += desc_t.h + 18
 
         # Controls: show up to 4 players' bindings
-        cfg = self._load_bindings()
-        players = cfg.get("players", {})
         for pnum in range(1, 5):
-            pid = str(pnum)
-            actions = players.get(pid, {})
-            line = (
-                f"P{pid}: up={actions.get('up','')} down={actions.get('down','')} "
-                f"left={actions.get('left','')} right={actions.get('right','')}"
-            )
-            ctrl_surf = self.font.render(line, True, (210, 210, 230))
-            surface.blit(ctrl_surf, (panel_rect.left + 40, y))
-            y += ctrl_surf.get_height() + 4
+            ctrl = cached_text(self.font, self.app.binding_label(str(pnum)), (210, 210, 230))
+            panel.blit(ctrl.surf, (panel_rect.left + 40, y))
+            y += ctrl.h + 4
+        return panel
 
+    def _background(self, *layout) -> pygame.Surface:
+        old = self._bg
+        bg = super()._background(*layout)
+        if bg is not old:
+            # Info panel; its contents are fixed while this page is up
+            bg.blit(self._panel, self._panel_rect)
+        return bg
 
-class SinglePlayerGameSelectScene(Scene):
-    """Card-based selector for single-player games.
+    def _draw_item(self, surface: pygame.Surface, rect: pygame.Rect, label: str, fill: tuple[int, int, int]):
+        super()._draw_item(surface, rect, label, fill)
+        # The info panel sits above the Start/Back boxes
+        covered = rect.clip(self._panel_rect)
+        if covered:
+            panel = self._panel_rect
+            surface.blit(self._panel, covered, covered.move(-panel.x, -panel.y))
 
-    Displays fixed-size game cards in a grid with keyboard and mouse
-    navigation and a smooth-moving highlight frame.
-    """
 
-    def __init__(self, app: "App"):
-        self.app = app
-        self.font = app.font
-        self.big_font = app.big_font
-        # Slightly smaller font for card content so text fits cleanly.
-        self.card_font = pygame.font.SysFont("consolas", 18)
+class SinglePlayerGameSelectScene(_CardGridScene):
+    """Card-based selector for single-player games."""
+
+    __slots__ = ()
 
+    def __init__(self, app: "App"):
         # Define available single-player games with metadata.
         # Keep descriptions very short so they fit comfortably on one line.
-        self.cards: list[dict[str, Any]] = [
+        cards = [
             {"id": "snake", "title": "Snake", "desc": "Classic snake.", "mode": "Singleplayer"},
             {"id": "brick_breaker", "title": "Brick Breaker", "desc": "Break falling bricks.", "mode": "Singleplayer"},
             {"id": "whack_a_box", "title": "Whack-a-Box", "desc": "Hit popping boxes.", "mode": "Singleplayer"},
@@ -588,171 +1033,7 @@ class SinglePlayerGameSelectScene(Scene):
         ]
 
         # Use three columns so the 12 games form a 3x4 grid.
-        self.cols = 3
-        self.selected_index = 0
-        self.card_rects: list[pygame.Rect] = []
-        self._build_layout()
-
-        # Highlight frame center for smooth movement
-        if self.card_rects:
-            cx, cy = self.card_rects[0].center
-        else:
-            cx, cy = WIDTH // 2, HEIGHT // 2
-        self.highlight_center = [float(cx), float(cy)]
-
-    def _build_layout(self):
-        # Grid region under the title and above the footer.
-        margin_x = 80
-        margin_top = 140
-        margin_bottom = 90
-        region = pygame.Rect(
-            margin_x,
-            margin_top,
-            WIDTH - 2 * margin_x,
-            HEIGHT - margin_top - margin_bottom,
-        )
-        gap_x = 22
-        gap_y = 22
-
-        rows = (len(self.cards) + self.cols - 1) // self.cols
-        if rows <= 0:
-            self.card_rects = []
-            return
-
-        card_w = (region.width - gap_x * (self.cols - 1)) // self.cols
-        card_h = (region.height - gap_y * (rows - 1)) // rows
-
-        total_w = self.cols * card_w + (self.cols - 1) * gap_x
-        total_h = rows * card_h + (rows - 1) * gap_y
-        offset_x = region.left + (region.width - total_w) // 2
-        offset_y = region.top + (region.height - total_h) // 2
-
-        self.card_rects.clear()
-        for i, _ in enumerate(self.cards):
-            row = i // self.cols
-            col = i % self.cols
-            x = offset_x + col * (card_w + gap_x)
-            y = offset_y + row * (card_h + gap_y)
-            self.card_rects.append(pygame.Rect(x, y, card_w, card_h))
-
-    def _fit_text(self, text: str, max_width: int) -> str:
-        """Trim text with ellipsis so it fits within max_width pixels."""
-        if not text:
-            return text
-        surf = self.card_font.render(text, True, (0, 0, 0))
-        if surf.get_width() <= max_width:
-            return text
-        ellipsis = "..."
-        trimmed = text
-        while trimmed and self.card_font.render(trimmed + ellipsis, True, (0, 0, 0)).get_width() > max_width:
-            trimmed = trimmed[:-1]
-        return trimmed + ellipsis if trimmed else ellipsis
-
-    def handle_event(self, event: pygame.event.Event):
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.app.scene_manager.set(ModeSelectScene(self.app))
-                return
-            if not self.card_rects:
-                return
-            cols = self.cols
-            idx = self.selected_index
-            row = idx // cols
-            col = idx % cols
-            if event.key in (pygame.K_LEFT, pygame.K_a):
-                if col > 0:
-                    idx -= 1
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                if col < cols - 1 and idx + 1 < len(self.cards):
-                    idx += 1
-            elif event.key in (pygame.K_UP, pygame.K_w):
-                if row > 0:
-                    idx -= cols
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                if idx + cols < len(self.cards):
-                    idx += cols
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self._activate(self.selected_index)
-            self.selected_index = max(0, min(idx, len(self.cards) - 1))
-        elif event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-            for i, r in enumerate(self.card_rects):
-                if r.collidepoint(mx, my):
-                    self.selected_index = i
-                    break
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            for i, r in enumerate(self.card_rects):
-                if r.collidepoint(mx, my):
-                    self.selected_index = i
-                    self._activate(i)
-                    break
-        elif event.type == pygame.MOUSEWHEEL:
-            # Scroll up/down by rows
-            if not self.card_rects:
-                return
-            cols = self.cols
-            idx = self.selected_index
-            if event.y > 0 and idx - cols >= 0:
-                idx -= cols
-            elif event.y < 0 and idx + cols < len(self.cards):
-                idx += cols
-            self.selected_index = idx
-
-    def _activate(self, index: int):
-        if index < 0 or index >= len(self.cards):
-            return
-        card = self.cards[index]
-        # Step 2: go to single-player game detail page
-        self.app.scene_manager.set(SinglePlayerGameDetailScene(self.app, card))
-
-    def update(self, dt: float):
-        # Smoothly move highlight frame toward the selected card.
-        if not self.card_rects or self.selected_index >= len(self.card_rects):
-            return
-        target = self.card_rects[self.selected_index].center
-        speed = 12.0
-        for i in (0, 1):
-            delta = target[i] - self.highlight_center[i]
-            self.highlight_center[i] += delta * min(1.0, speed * dt)
-
-    def draw(self, surface: pygame.Surface):
-        surface.fill(BG_COLOR)
-        # Title
-        title = self.big_font.render("Single Player", True, (255, 255, 255))
-        title_y = 80
-        surface.blit(title, (WIDTH // 2 - title.get_width() // 2, title_y))
-
-        # Footer hint
-        hint = self.font.render("Arrows/Mouse: Select  Enter/Click: Start  Esc: Back", True, (180, 180, 180))
-        hint_y = HEIGHT - 50
-        surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, hint_y))
-
-        # Draw cards
-        base_col = (50, 50, 80)
-        hover_col = (90, 90, 140)
-        outline_col = (180, 180, 230)
-
-        for i, (card, rect) in enumerate(zip(self.cards, self.card_rects)):
-            is_sel = (i == self.selected_index)
-            fill = hover_col if is_sel else base_col
-            pygame.draw.rect(surface, fill, rect)
-            pygame.draw.rect(surface, outline_col, rect, 2)
-            # Compact card: only render game title centered in the box
-            max_text_w = rect.width - 24  # horizontal padding
-            title_text = self._fit_text(card["title"], max_text_w)
-            t_surf = self.card_font.render(title_text, True, (240, 240, 240))
-            t_x = rect.centerx - t_surf.get_width() // 2
-            t_y = rect.centery - t_surf.get_height() // 2
-            surface.blit(t_surf, (t_x, t_y))
-
-        # Highlight frame with smooth movement
-        if self.card_rects:
-            hw = self.card_rects[0].width + 16
-            hh = self.card_rects[0].height + 16
-            frame = pygame.Rect(0, 0, hw, hh)
-            frame.center = (int(self.highlight_center[0]), int(self.highlight_center[1]))
-            pygame.draw.rect(surface, (230, 230, 255), frame, 3)
+        super().__init__(app, "Single Player", cards, cols=3, detail=SinglePlayerGameDetailScene)
 
 
 class SinglePlayerGameDetailScene(BaseMenuScene):
@@ -761,18 +1042,32 @@ class SinglePlayerGameDetailScene(BaseMenuScene):
     Shows title, description, controls, and Start/Back buttons.
     """
 
+    __slots__ = ("card", "_starts", "_panel_rect", "_panel")
+
     def __init__(self, app: "App", card: dict[str, Any]):
         items = ["Start", "Back"]
         super().__init__(app, "Single Player — Game", items)
         self.card = card
-
-    def _load_bindings(self) -> dict:
-        cfg_path = os.path.join(os.path.dirname(__file__), "keybindings.json")
-        try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {"players": {}}
+        # Card id -> how to start it; one lookup instead of an if/elif chain
+        self._starts = {
+            "snake": app.launch_snake_game,
+            "control_zone": partial(app.launch_control_zone_game, 1),
+            "trail_lock": partial(app.launch_trail_lock_game, 1),
+            "brick_breaker": app.launch_brick_breaker_game,
+            "whack_a_box": app.launch_whack_a_box_game,
+            "box_stack": app.launch_box_stack_game,
+            "simon_grid": app.launch_simon_grid_game,
+            "maze_runner": app.launch_maze_runner_game,
+            "ttt_single": partial(app.go, TttSingleLevelSelectScene),
+            "sudoku": partial(app.go, SudokuLevelSelectScene),
+            "survival": app.launch_survival_game,
+            "flappy_box": app.launch_flappy_box_game,
+            "tetris_box": app.launch_tetris_box_game,
+            "zip_box": app.launch_zip_box_game,
+        }
+        self._panel_rect = pygame.Rect(0, 0, WIDTH - 200, 260)
+        self._panel_rect.center = (WIDTH // 2, HEIGHT // 2)
+        self._panel = self._panel_surface()
 
     def handle_select(self, index: int):
         label = self.items[index]
@@ -780,148 +1075,137 @@ class SinglePlayerGameDetailScene(BaseMenuScene):
             self._start_game()
         elif label == "Back":
             # Return to the single-player grid
-            self.app.scene_manager.set(SinglePlayerGameSelectScene(self.app))
+            self.app.go(SinglePlayerGameSelectScene)
 
     def _start_game(self):
         cid = self.card.get("id", "")
         self.app.lobby.mode = "single"
-        if cid == "snake":
-            self.app.lobby.game = "snake"
-            self.app.launch_snake_game()
-        elif cid == "control_zone":
-            self.app.lobby.game = "control_zone"
-            self.app.launch_control_zone_game(1)
-        elif cid == "trail_lock":
-            self.app.lobby.game = "trail_lock"
-            self.app.launch_trail_lock_game(1)
-        elif cid == "brick_breaker":
-            self.app.lobby.game = "brick_breaker"
-            self.app.launch_brick_breaker_game()
-        elif cid == "whack_a_box":
-            self.app.lobby.game = "whack_a_box"
-            self.app.launch_whack_a_box_game()
-        elif cid == "box_stack":
-            self.app.lobby.game = "box_stack"
-            self.app.launch_box_stack_game()
-        elif cid == "simon_grid":
-            self.app.lobby.game = "simon_grid"
-            self.app.launch_simon_grid_game()
-        elif cid == "maze_runner":
-            self.app.lobby.game = "maze_runner"
-            self.app.launch_maze_runner_game()
-        elif cid == "ttt_single":
-            self.app.lobby.game = "ttt_single"
-            self.app.scene_manager.set(TttSingleLevelSelectScene(self.app))
-        elif cid == "sudoku":
-            self.app.lobby.game = "sudoku"
-            self.app.scene_manager.set(SudokuLevelSelectScene(self.app))
-        elif cid == "survival":
-            self.app.lobby.game = "survival"
-            self.app.launch_survival_game()
-        elif cid == "flappy_box":
-            self.app.lobby.game = "flappy_box"
-            self.app.launch_flappy_box_game()
-        elif cid == "tetris_box":
-            self.app.lobby.game = "tetris_box"
-            self.app.launch_tetris_box_game()
-        elif cid == "zip_box":
-            self.app.lobby.game = "zip_box"
-            self.app.launch_zip_box_game()
-
-    def draw(self, surface: pygame.Surface):
-        # Use BaseMenuScene to draw the title, Start/Back buttons, and hints
-        super().draw(surface)
-
-        # Info panel box
-        panel_w = WIDTH - 200
-        panel_h = 260
-        panel_rect = pygame.Rect(0, 0, panel_w, panel_h)
-        panel_rect.center = (WIDTH // 2, HEIGHT // 2)
-        pygame.draw.rect(surface, (40, 40, 70), panel_rect)
-        pygame.draw.rect(surface, (160, 160, 210), panel_rect, 2)
+        start = self._starts.get(cid)
+        if start is not None:
+            self.app.lobby.game = cid
+            start()
+
+    def _panel_surface(self) -> pygame.Surface:
+        """Compose the info panel (title, description, controls) once."""
+        panel = pygame.Surface(self._panel_rect.size).convert()
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, (40, 40, 70), panel_rect)
+        pygame.draw.rect(panel, (160, 160, 210), panel_rect, 2)
 
         title_text = self.card.get("title", "")
         desc_text = self.card.get("desc", "")
 
         y = panel_rect.top + 20
-        title_surf = self.big_font.render(title_text, True, (245, 245, 255))
-        surface.blit(title_surf, (panel_rect.centerx - title_surf.get_width() // 2, y))
-        y += title_surf.get_height() + 12
+        title_t = cached_text(self.big_font, title_text, (245, 245, 255))
+        panel.blit(title_t.surf, (panel_rect.centerx - title_t.w // 2, y))
+        y += title_t.h + 12
 
         if desc_text:
-            desc_surf = self.font.render(desc_text, True, (225, 225, 235))
-            surface.blit(desc_surf, (panel_rect.centerx - desc_surf.get_width() // 2, y))
-            y += desc_surf.get_height() + 18
+            desc_t = cached_text(self.font, desc_text, (225, 225, 235))
+            panel.blit(desc_t.surf, (panel_rect.centerx - desc_t.w // 2, y))
+            y += desc_t.h + 18
 
         # Controls (single-player: show P1 only)
-        cfg = self._load_bindings()
-        players = cfg.get("players", {})
-        p1 = players.get("1", {})
-        ctrl_line = (
-            f"P1 Controls: up={p1.get('up','')} down={p1.get('down','')} "
-            f"left={p1.get('left','')} right={p1.get('right','')}"
-        )
-        ctrl_surf = self.font.render(ctrl_line, True, (210, 210, 230))
-        surface.blit(ctrl_surf, (panel_rect.centerx - ctrl_surf.get_width() // 2, y))
-
+        ctrl = cached_text(self.font, self.app.binding_label("1", "P1 Controls:"), (210, 210, 230))
+        panel.blit(ctrl.surf, (panel_rect.centerx - ctrl.w // 2, y))
+        return panel
+
+    def _background(self, *layout) -> pygame.Surface:
+        old = self._bg
+        bg = super()._background(*layout)
+        if bg is not old:
+            # Info panel; its contents are fixed while this page is up
+            bg.blit(self._panel, self._panel_rect)
+        return bg
+
+    def _draw_item(self, surface: pygame.Surface, rect: pygame.Rect, label: str, fill: tuple[int, int, int]):
+        super()._draw_item(surface, rect, label, fill)
+        # The info panel sits above the Start/Back boxes
+        covered = rect.clip(self._panel_rect)
+        if covered:
+            panel = self._panel_rect
+            surface.blit(self._panel, covered, covered.move(-panel.x, -panel.y))
 
 
 class ControlsScene(BaseMenuScene):
+    __slots__ = (
+        "cfg_path", "cfg", "player_ids", "actions", "selected_player_index",
+        "selected_action_index", "waiting_for_key", "save_failed", "_actions_refs",
+        "_row_rects", "_shown",
+    )
+
     def __init__(self, app: "App"):
         items = ["Back"]
         super().__init__(app, "Controls", items)
-        self.cfg_path = os.path.join(os.path.dirname(__file__), "keybindings.json")
-        try:
-            with open(self.cfg_path, "r", encoding="utf-8") as f:
-                self.cfg = json.load(f)
-        except Exception:
-            self.cfg = {"players": {}}
+        self.cfg_path = app.keybindings_path
+        # Shared with the other scenes, so rebinds show up everywhere
+        self.cfg = app.keybindings
 
         players = self.cfg.get("players", {})
         # Sorted list of player ID strings ("1", "2", ...)
         self.player_ids = sorted(players.keys(), key=lambda x: int(x)) if players else []
+        # Player id -> that player's action map inside self.cfg; rebinds
+        # write straight into it
+        self._actions_refs: dict[str, dict[str, str]] = {pid: players[pid] for pid in self.player_ids}
         # Editable actions per player
         self.actions = ["up", "down", "left", "right"]
         self.selected_player_index = 0
         self.selected_action_index = 0
         # When True, the next non-ESC key press becomes the new binding
         self.waiting_for_key = False
+        # Set when the last rebind could not be written to cfg_path
+        self.save_failed = False
+
+        # Row layout is static; build (row, box-relative swatch, text_x,
+        # swatch color) once per player
+        box_w, box_h, gap, start_y = 560, 70, 12, 160
+        swatch = pygame.Rect(10, 10, 40, 40)
+        self._row_rects: list[tuple[pygame.Rect, pygame.Rect, int, tuple[int, int, int]]] = []
+        for i, pid in enumerate(self.player_ids):
+            rect = pygame.Rect(WIDTH//2 - box_w//2, start_y + i*(box_h+gap), box_w, box_h)
+            color = PLAYER_COLORS[(int(pid)-1) % len(PLAYER_COLORS)]
+            self._row_rects.append((rect, swatch, rect.left + swatch.right + 12, color))
+        # Selection state last painted; None forces a repaint
+        self._shown: tuple | None = None
 
     def handle_select(self, index: int):
         # Only one menu item (Back); go home
-        self.app.scene_manager.set(HomeScene(self.app))
+        self.app.go(HomeScene)
 
     def _keycode_to_binding_name(self, key: int) -> str:
         """Convert a pygame keycode to a readable binding name for JSON.
 
         Produces values that InputHandler._normalize_key_name understands.
         """
-        # Letters: map to K_X style
+        # Unlisted keys use pygame's key name (e.g., "space"), which
+        # InputHandler can resolve via pygame.key.key_code.
+        return _KEYCODE_NAMES.get(key) or pygame.key.name(key)
+
+    def _save_bindings(self) -> bool:
+        """Write the bindings to a temp file and rename it over the config.
+
+        The rename is atomic, so a crash mid-write leaves the old file intact.
+        Returns False if the file could not be written.
+        """
+        tmp = None
         try:
-            ch = chr(key)
-            if "a" <= ch <= "z" or "A" <= ch <= "Z":
-                return f"K_{ch.upper()}"
-        except Exception:
-            pass
-
-        # Arrow keys
-        if key == pygame.K_UP:
-            return "K_UP"
-        if key == pygame.K_DOWN:
-            return "K_DOWN"
-        if key == pygame.K_LEFT:
-            return "K_LEFT"
-        if key == pygame.K_RIGHT:
-            return "K_RIGHT"
-
-        # Numpad digits 0-9
-        if pygame.K_KP0 <= key <= pygame.K_KP9:
-            digit = key - pygame.K_KP0
-            return f"K_KP{digit}"
-
-        # Fallback to pygame key name (e.g., "space"), which
-        # InputHandler.from_file can resolve via pygame.key.key_code.
-        return pygame.key.name(key)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(self.cfg_path) or ".",
+                suffix=".tmp", delete=False,
+            ) as f:
+                tmp = f.name
+                json.dump(self.cfg, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.cfg_path)
+        except OSError:
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return False
+        return True
 
     def handle_event(self, event: pygame.event.Event):
         # Custom handling so this scene can edit keybindings.
@@ -932,30 +1216,23 @@ class ControlsScene(BaseMenuScene):
                     # Cancel rebind, stay in scene
                     self.waiting_for_key = False
                 else:
-                    self.app.scene_manager.set(HomeScene(self.app))
+                    self.app.go(HomeScene)
                 return
 
             # If we're waiting for a new key, capture it
             if self.waiting_for_key and self.player_ids:
                 binding_name = self._keycode_to_binding_name(event.key)
                 pid = self.player_ids[self.selected_player_index]
-                players = self.cfg.setdefault("players", {})
-                actions_map = players.setdefault(pid, {})
                 action = self.actions[self.selected_action_index]
-                actions_map[action] = binding_name
+                self._actions_refs[pid][action] = binding_name
+                self.app.bindings_changed()
 
-                # Persist to disk
-                try:
-                    with open(self.cfg_path, "w", encoding="utf-8") as f:
-                        json.dump(self.cfg, f, indent=2)
-                except Exception:
-                    pass
+                # The rebind stays live for this session even if saving fails
+                self.save_failed = not self._save_bindings()
 
-                # Reload input handler so changes are live
-                try:
-                    self.app.input_handler = InputHandler.from_file(self.cfg_path)
-                except Exception:
-                    pass
+                # Swap in a handler for the edited bindings so changes are
+                # live; they are already in memory, no need to re-read the file
+                self.app.input_handler = InputHandler.from_dict(self.cfg)
 
                 self.waiting_for_key = False
                 return
@@ -963,15 +1240,15 @@ class ControlsScene(BaseMenuScene):
             # Navigation between players and actions when not rebinding
             if not self.player_ids:
                 return
-            if event.key in (pygame.K_UP, pygame.K_w):
+            if event.key in _KEYS_UP:
                 self.selected_player_index = (self.selected_player_index - 1) % len(self.player_ids)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
+            elif event.key in _KEYS_DOWN:
                 self.selected_player_index = (self.selected_player_index + 1) % len(self.player_ids)
-            elif event.key in (pygame.K_LEFT, pygame.K_a):
+            elif event.key in _KEYS_LEFT:
                 self.selected_action_index = (self.selected_action_index - 1) % len(self.actions)
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
+            elif event.key in _KEYS_RIGHT:
                 self.selected_action_index = (self.selected_action_index + 1) % len(self.actions)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _KEYS_CONFIRM:
                 # Begin waiting for the next key press to assign
                 self.waiting_for_key = True
 
@@ -979,71 +1256,94 @@ class ControlsScene(BaseMenuScene):
             # Allow clicking the Back button
             rects, _, _, _, _ = self._layout()
             if rects and rects[0].collidepoint(event.pos):
-                self.app.scene_manager.set(HomeScene(self.app))
-
-    def draw(self, surface: pygame.Surface):
+                self.waiting_for_key = False
+                self.app.go(HomeScene)
+
+    def invalidate(self):
+        super().invalidate()
+        self._shown = None
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        # The table only changes with the selection or a rebind (which
+        # always ends waiting_for_key), so idle frames repaint nothing
+        shown = (
+            self.selected, self.selected_player_index, self.selected_action_index,
+            self.waiting_for_key, self.save_failed,
+        )
+        if shown == self._shown:
+            return []
+        self._shown = shown
         super().draw(surface)
-        players = self.cfg.get("players", {})
-        start_y = 160
-        box_w = 560
-        box_h = 70
-        gap = 12
-        # Ensure internal player_ids stays in sync if config changed
-        if players and not getattr(self, "player_ids", None):
-            self.player_ids = sorted(players.keys(), key=lambda x: int(x))
-
-        for i, pid in enumerate(sorted(players.keys(), key=lambda x: int(x))):
-            rect = pygame.Rect(WIDTH//2 - box_w//2, start_y + i*(box_h+gap), box_w, box_h)
-            is_sel_player = (self.player_ids and pid == self.player_ids[self.selected_player_index])
+        # Rebinds only edit existing players, so the ids sorted in __init__
+        # still match the config
+        batch = []
+        for (rect, swatch, text_x, color), pid in zip(self._row_rects, self.player_ids):
+            is_sel_player = pid == self.player_ids[self.selected_player_index]
             fill_col = (80, 80, 110) if is_sel_player else (60, 60, 80)
             border_col = (190, 190, 230) if is_sel_player else (150, 150, 190)
-            pygame.draw.rect(surface, fill_col, rect)
-            pygame.draw.rect(surface, border_col, rect, 2)
-
-            color = PLAYER_COLORS[(int(pid)-1) % len(PLAYER_COLORS)]
-            swatch = pygame.Rect(rect.left+10, rect.top+10, 40, 40)
-            pygame.draw.rect(surface, color, swatch)
-
-            actions = players.get(pid, {})
-            # Highlight the currently selected action for this player
-            def decorate(action_name: str, idx: int) -> str:
-                val = actions.get(action_name, "")
-                if is_sel_player and idx == self.selected_action_index:
-                    return f"[{val or 'UNSET'}]"
-                return val or ""
-
-            up_val = decorate("up", 0)
-            down_val = decorate("down", 1)
-            left_val = decorate("left", 2)
-            right_val = decorate("right", 3)
-
-            text = (
-                f"P{pid}: up={up_val} down={down_val} "
-                f"left={left_val} right={right_val}"
-            )
-            surf = self.font.render(text, True, (220, 220, 230))
-            surface.blit(surf, (swatch.right + 12, rect.centery - surf.get_height()//2))
+            batch.append((_info_box(rect.size, fill_col, border_col, swatch, color), rect))
+
+            if is_sel_player:
+                actions = self._actions_refs[pid]
+                sel_action = self.selected_action_index
+                # Highlight the currently selected action for this player
+                text = f"P{pid}: " + " ".join(
+                    f"{name}=[{actions.get(name) or 'UNSET'}]" if i == sel_action
+                    else f"{name}={actions.get(name) or ''}"
+                    for i, name in enumerate(self.actions)
+                )
+            else:
+                text = self.app.binding_label(pid)
+            row = cached_text(self.font, text, (220, 220, 230))
+            batch.append((row.surf, (text_x, rect.centery - row.h//2)))
+        surface.blits(batch, doreturn=False)
 
         # Instructions / status line
-        if getattr(self, "player_ids", None) and self.player_ids:
+        if self.player_ids:
             pid = self.player_ids[self.selected_player_index]
             action = self.actions[self.selected_action_index]
+            color = (230, 230, 240)
             if self.waiting_for_key:
                 msg = f"Press a key for P{pid} {action.upper()}  (ESC to cancel)"
+            elif self.save_failed:
+                msg = "Could not save key bindings; changes last until you quit"
+                color = (240, 140, 140)
             else:
                 msg = "Arrows: select player/action   Enter: rebind   ESC: Back"
-            info = self.font.render(msg, True, (230, 230, 240))
-            surface.blit(info, (WIDTH//2 - info.get_width()//2, HEIGHT - 80))
+            info = cached_text(self.font, msg, color)
+            surface.blit(info.surf, (WIDTH//2 - info.w//2, HEIGHT - 80))
+        return None
 
 
 class PlayerSetupScene(BaseMenuScene):
+    __slots__ = ("min_players", "max_players", "_counter_n", "_counter", "_launchers", "_row_rects", "_shown")
+
     def __init__(self, app: "App"):
         items = ["Start Game", "Back"]
         super().__init__(app, "Player Setup (PvP)", items)
         self.min_players = 2
         self.max_players = 4
-        if not hasattr(self.app.lobby, "num_players"):
-            self.app.lobby.num_players = self.min_players
+        # "Players: N" label, re-rendered only when N changes
+        self._counter_n = -1
+        self._counter: Text | None = None
+        # Lobby game -> launcher taking the player count
+        self._launchers = {
+            "survival_pvp": app.launch_survival_pvp_game,
+            "control_zone": app.launch_control_zone_game,
+            "trail_lock": app.launch_trail_lock_game,
+        }
+
+        # Precompute (row, box-relative swatch, text_x, swatch color, player
+        # id) for every possible player row
+        box_w, box_h, gap, start_y = 600, 64, 10, 220
+        swatch = pygame.Rect(10, 12, 40, 40)
+        self._row_rects: list[tuple[pygame.Rect, pygame.Rect, int, tuple[int, int, int], str]] = []
+        for i in range(self.max_players):
+            rect = pygame.Rect(WIDTH//2 - box_w//2, start_y + i*(box_h+gap), box_w, box_h)
+            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
+            self._row_rects.append((rect, swatch, rect.left + swatch.right + 12, color, str(i+1)))
+        # (selected item, player count) last painted; None forces a repaint
+        self._shown: tuple[int, int] | None = None
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
@@ -1056,101 +1356,103 @@ class PlayerSetupScene(BaseMenuScene):
     def handle_select(self, index: int):
         label = self.items[index]
         if label == "Start Game":
-            if self.app.lobby.game == "tag":
+            game = self.app.lobby.game
+            if game == "tag":
                 # Go to Tag-specific settings before starting the match
-                self.app.scene_manager.set(TagSettingsScene(self.app))
-            elif self.app.lobby.game == "survival_pvp":
-                self.app.launch_survival_pvp_game(self.app.lobby.num_players)
-            elif self.app.lobby.game == "control_zone":
-                self.app.launch_control_zone_game(self.app.lobby.num_players)
-            elif self.app.lobby.game == "trail_lock":
-                self.app.launch_trail_lock_game(self.app.lobby.num_players)
+                self.app.go(TagSettingsScene)
+            else:
+                launch = self._launchers.get(game)
+                if launch is not None:
+                    launch(self.app.lobby.num_players)
         elif label == "Back":
-            self.app.scene_manager.set(GameSelectScene(self.app))
-
-    def draw(self, surface: pygame.Surface):
+            self.app.go(GameSelectScene)
+
+    def invalidate(self):
+        super().invalidate()
+        self._shown = None
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        num_players = self.app.lobby.num_players
+        shown = (self.selected, num_players)
+        if shown == self._shown:
+            return []
+        self._shown = shown
         super().draw(surface)
         counter_rect = pygame.Rect(WIDTH//2 - 140, 150, 280, 50)
-        pygame.draw.rect(surface, (60, 60, 80), counter_rect)
-        pygame.draw.rect(surface, (150, 150, 190), counter_rect, 2)
-        text = self.font.render(f"Players: {self.app.lobby.num_players}  (Left/Right)", True, (220, 220, 230))
-        surface.blit(text, (counter_rect.centerx - text.get_width()//2, counter_rect.centery - text.get_height()//2))
+        if num_players != self._counter_n:
+            self._counter = cached_text(self.font, f"Players: {num_players}  (Left/Right)", (220, 220, 230))
+            self._counter_n = num_players
+        counter = self._counter
+        # Counter box and every row go out in one Surface.blits() call
+        batch = [
+            (_info_box(counter_rect.size, (60, 60, 80), (150, 150, 190)), counter_rect),
+            (counter.surf, counter.centered(counter_rect.centerx, counter_rect.centery)),
+        ]
 
-        cfg_path = os.path.join(os.path.dirname(__file__), "keybindings.json")
-        try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
-        except Exception:
-            cfg = {"players": {}}
-        players_map = cfg.get("players", {})
-
-        start_y = 220
-        box_w = 600
-        box_h = 64
-        gap = 10
-        for i in range(self.app.lobby.num_players):
-            pid = str(i+1)
-            rect = pygame.Rect(WIDTH//2 - box_w//2, start_y + i*(box_h+gap), box_w, box_h)
-            pygame.draw.rect(surface, (60, 60, 80), rect)
-            pygame.draw.rect(surface, (150, 150, 190), rect, 2)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            swatch = pygame.Rect(rect.left+10, rect.top+12, 40, 40)
-            pygame.draw.rect(surface, color, swatch)
-            actions = players_map.get(pid, {})
-            text = f"P{pid}: up={actions.get('up','')} down={actions.get('down','')} left={actions.get('left','')} right={actions.get('right','')}"
-            surf = self.font.render(text, True, (220, 220, 230))
-            surface.blit(surf, (swatch.right + 12, rect.centery - surf.get_height()//2))
+        for rect, swatch, text_x, color, pid in self._row_rects[:num_players]:
+            batch.append((_info_box(rect.size, (60, 60, 80), (150, 150, 190), swatch, color), rect))
+            row = cached_text(self.font, self.app.binding_label(pid), (220, 220, 230))
+            batch.append((row.surf, (text_x, rect.centery - row.h//2)))
+        surface.blits(batch, doreturn=False)
+        return None
 
 
 class TagSettingsScene(BaseMenuScene):
     """Pregame settings screen for PvP Tag variants."""
 
+    __slots__ = ()
+
+    # One row per setting: (lobby attribute, label, choice count). Settings
+    # without a count are ON/OFF toggles; the rest cycle through 1..count.
+    _settings = (
+        ("tag_double_jump", "Double Jump", None),
+        ("tag_map_index", "Map", 3),
+        ("tag_enable_moving", "Moving Platforms", None),
+        ("tag_enable_dropthrough", "Drop-through Platforms", None),
+        ("tag_enable_speed", "Speed Platforms", None),
+    )
+
     def __init__(self, app: "App"):
-        # Items are placeholders; labels are filled dynamically in draw()
-        items = [
-            "Double Jump",
-            "Map",
-            "Moving Platforms",
-            "Drop-through Platforms",
-            "Speed Platforms",
-            "Start Match",
-            "Back",
-        ]
+        # Setting labels are filled in from the lobby by _refresh_labels()
+        items = [label for _, label, _ in self._settings] + ["Start Match", "Back"]
         super().__init__(app, "Tag Settings", items)
+        self._refresh_labels()
 
-    def handle_select(self, index: int):
+    def _refresh_labels(self):
         lobby = self.app.lobby
-        if index == 0:
-            lobby.tag_double_jump = not lobby.tag_double_jump
-        elif index == 1:
-            lobby.tag_map_index = (lobby.tag_map_index + 1) % 3
-        elif index == 2:
-            lobby.tag_enable_moving = not lobby.tag_enable_moving
-        elif index == 3:
-            lobby.tag_enable_dropthrough = not lobby.tag_enable_dropthrough
-        elif index == 4:
-            lobby.tag_enable_speed = not lobby.tag_enable_speed
-        elif index == 5:
+        for i, (attr, label, count) in enumerate(self._settings):
+            value = getattr(lobby, attr)
+            if count is None:
+                self.items[i] = f"{label}: {'ON' if value else 'OFF'}"
+            else:
+                self.items[i] = f"{label}: {value + 1}/{count}"
+
+    def handle_select(self, index: int):
+        if index < len(self._settings):
+            lobby = self.app.lobby
+            attr, _, count = self._settings[index]
+            value = getattr(lobby, attr)
+            setattr(lobby, attr, not value if count is None else (value + 1) % count)
+            # New labels give a new backdrop, which draw() picks up
+            self._refresh_labels()
+        elif index == len(self._settings):
             # Start the Tag match with current settings
             self.app.launch_tag_game(self.app.lobby.num_players)
-        elif index == 6:
-            self.app.scene_manager.set(PlayerSetupScene(self.app))
+        else:
+            self.app.go(PlayerSetupScene)
 
-    def draw(self, surface: pygame.Surface):
-        # Update labels to reflect current settings before drawing
-        lobby = self.app.lobby
-        self.items[0] = f"Double Jump: {'ON' if lobby.tag_double_jump else 'OFF'}"
-        self.items[1] = f"Map: {lobby.tag_map_index + 1}/3"
-        self.items[2] = f"Moving Platforms: {'ON' if lobby.tag_enable_moving else 'OFF'}"
-        self.items[3] = f"Drop-through Platforms: {'ON' if lobby.tag_enable_dropthrough else 'OFF'}"
-        self.items[4] = f"Speed Platforms: {'ON' if lobby.tag_enable_speed else 'OFF'}"
-        # Last two items are static
-        self.items[5] = "Start Match"
-        self.items[6] = "Back"
-        super().draw(surface)
+    def invalidate(self):
+        # Entering the screen: show the lobby's current settings
+        super().invalidate()
+        self._refresh_labels()
 
 
 class MenuScene(Scene):
+    __slots__ = ("app", "font", "big_font", "num_humans", "num_bots", "match_time", "_bg")
+
+    needs_animation = False
+    paused = True
+
     def __init__(self, app: "App"):
         self.app = app
         self.font = app.font
@@ -1158,13 +1460,38 @@ class MenuScene(Scene):
         self.num_humans = 2
         self.num_bots = 0
         self.match_time = 60
+        self._bg = self._background()
+
+    def _background(self) -> pygame.Surface:
+        """Prerender the title, prompts and info lines, which never change."""
+        bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        bg.fill(BG_COLOR)
+        title = cached_text(self.big_font, "BOX ARCADE - TAG", (255, 255, 255))
+        bg.blit(title.surf, (WIDTH//2 - title.w//2, 80))
+
+        prompts = [
+            "Press Enter to Start",
+            "Esc to Quit",
+        ]
+        for i, text in enumerate(prompts, start=3):
+            line = cached_text(self.font, text, (220, 220, 220))
+            bg.blit(line.surf, (WIDTH//2 - line.w//2, 200 + i * 28))
+
+        info = [
+            "Per-player key bindings are in keybindings.json.",
+            "Use symbolic names (e.g., 'K_W', 'K_LEFT', 'K_KP8').",
+        ]
+        for i, text in enumerate(info):
+            line = cached_text(self.font, text, (180, 180, 180))
+            bg.blit(line.surf, (WIDTH//2 - line.w//2, 370 + i * 22))
+        return bg
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 self.start_game()
             elif event.key == pygame.K_ESCAPE:
-                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                self.app.running = False
             elif event.key == pygame.K_RIGHT:
                 self.num_humans = min(4, self.num_humans + 1)
             elif event.key == pygame.K_LEFT:
@@ -1182,82 +1509,58 @@ class MenuScene(Scene):
         pass
 
     def draw(self, surface: pygame.Surface):
-        surface.fill(BG_COLOR)
-        title = self.big_font.render("BOX ARCADE - TAG", True, (255, 255, 255))
-        surface.blit(title, (WIDTH//2 - title.get_width()//2, 80))
-
-        lines = [
+        surface.blit(self._bg, (0, 0))
+        # Only the counters change; cached_text caches each value's label
+        lines = (
             f"Humans: {self.num_humans}  (Left/Right)",
             f"Bots: {self.num_bots}      (Up/Down)",
             f"Match Time: {self.match_time}s (PageUp/PageDown)",
-            "Press Enter to Start",
-            "Esc to Quit",
-        ]
+        )
         for i, text in enumerate(lines):
-            surf = self.font.render(text, True, (220, 220, 220))
-            surface.blit(surf, (WIDTH//2 - surf.get_width()//2, 200 + i * 28))
-
-        info = [
-            "Per-player key bindings are in keybindings.json.",
-            "Use symbolic names (e.g., 'K_W', 'K_LEFT', 'K_KP8').",
-        ]
-        for i, text in enumerate(info):
-            surf = self.font.render(text, True, (180, 180, 180))
-            surface.blit(surf, (WIDTH//2 - surf.get_width()//2, 370 + i * 22))
+            line = cached_text(self.font, text, (220, 220, 220))
+            surface.blit(line.surf, (WIDTH//2 - line.w//2, 200 + i * 28))
 
     def start_game(self):
-        players: List[Player] = []
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        # Spawn grid positions
-        spawn_positions = [
-            (bounds.left + 40, bounds.top + 40),
-            (bounds.right - 80, bounds.top + 40),
-            (bounds.left + 40, bounds.bottom - 80),
-            (bounds.right - 80, bounds.bottom - 80),
-            (bounds.centerx - 40, bounds.centery - 40),
-            (bounds.centerx + 40, bounds.centery - 40),
-            (bounds.centerx - 40, bounds.centery + 40),
-            (bounds.centerx + 40, bounds.centery + 40),
-        ]
-
+        from games.tag import TagGame
         speed = 220.0
         size = 36
-        idx = 0
+        n_spawns = len(TAG_SPAWNS)
+        n_colors = len(PLAYER_COLORS)
         # Humans
-        for i in range(self.num_humans):
-            x, y = spawn_positions[idx % len(spawn_positions)]
-            idx += 1
-            rect = pygame.Rect(x, y, size, size)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            players.append(HumanPlayer(i + 1, f"P{i+1}", rect, color, speed, True))
+        players: List[Player] = _make_players(self.num_humans, size, speed, TAG_SPAWNS)
         # Bots
         for b in range(self.num_bots):
-            x, y = spawn_positions[idx % len(spawn_positions)]
-            idx += 1
+            idx = self.num_humans + b
+            x, y = TAG_SPAWNS[idx % n_spawns]
             rect = pygame.Rect(x, y, size, size)
-            color = PLAYER_COLORS[(self.num_humans + b) % len(PLAYER_COLORS)]
-            players.append(BotPlayer(self.num_humans + b + 1, f"Bot{b+1}", rect, color, speed * 0.95, False))
+            players.append(BotPlayer(idx + 1, f"Bot{b+1}", rect, PLAYER_COLORS[idx % n_colors], speed * 0.95, False))
 
-        game = TagGame(players, bounds, match_time=self.match_time)
+        game = TagGame(players, TAG_BOUNDS, match_time=self.match_time)
         self.app.scene_manager.set(GameScene(self.app, game))
 
 
 class GameScene(Scene):
+    __slots__ = ("app", "game", "font", "_game_handle_event")
+
+    precise_timing = True
+    # Games such as Zip Box track mouse drags through MOUSEMOTION
+    wants_mouse_motion = True
+
     def __init__(self, app: "App", game: Any):
         self.app = app
         self.game = game
         self.font = app.font
+        # Discrete event handler if the game has one (e.g., grid navigation)
+        self._game_handle_event = getattr(game, "handle_event", None)
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 # Open pause menu
                 self.app.scene_manager.set(PauseScene(self.app))
-        # Forward input events to handler for unified pressed tracking
-        self.app.input_handler.handle_event(event)
-        # Forward discrete events to the game if it supports its own handler (e.g., grid navigation)
-        if hasattr(self.game, "handle_event"):
-            self.game.handle_event(event)
+        # App.run already fed key events to the input handler
+        if self._game_handle_event is not None:
+            self._game_handle_event(event)
 
     def update(self, dt: float):
         # Use InputHandler's unified event-tracked state (pass None)
@@ -1273,6 +1576,16 @@ class GameScene(Scene):
 
 
 class ResultsScene(Scene):
+    # Built fresh for every finished match; keep instances dict-free
+    __slots__ = (
+        "app", "game", "font", "big_font", "items", "selected",
+        "sorted_scores", "name_colors", "_format_row", "_format_winner",
+        "_rects", "_grid", "_title", "_drawn", "_bg", "_button_surfs",
+    )
+
+    needs_animation = False
+    paused = True
+
     def __init__(self, app: "App", game: Any):
         self.app = app
         self.game = game
@@ -1294,30 +1607,84 @@ class ResultsScene(Scene):
         elif hasattr(game, "player"):
             p = game.player
             self.name_colors[p.name] = getattr(p, "color", (200, 200, 200))
+        self._format_row, self._format_winner = self._build_formatters(game)
+        # Button column and title are fixed for the life of the scene
+        self._rects = self._button_rects()
+        first = self._rects[0]
+        pitch_y = self._rects[1].top - first.top if len(self._rects) > 1 else first.height
+        self._grid = (first.left, first.top, first.width, first.height, first.width, pitch_y)
+        self._title = cached_text(self.big_font, "Results", (255, 255, 255))
+        # Selected button currently on screen; None forces a full repaint
+        self._drawn: int | None = None
+        # Scores never change while the scene is up: compose them once, and
+        # each button once per highlight state
+        self._bg = self._background()
+        self._button_surfs: dict[tuple[int, bool], pygame.Surface] = {}
+
+    @staticmethod
+    def _build_formatters(game: Any):
+        """Pick the row and winner-line formatters for this game once.
+
+        Whether values are shown, the label, and its unit are game-level
+        constants, so draw() only has to call the chosen functions.
+        """
+        show_values = (not getattr(game, "higher_time_wins", False)) or getattr(game, "show_time_in_results", False)
+        label = getattr(game, "result_label", "IT")
+        header = getattr(game, "results_header", None)
+
+        if not show_values:
+            def format_row(i: int, name: str, value: float) -> str:
+                return f"{i+1}. {name}"
+
+            def format_winner(name: str, value: float) -> str:
+                return f"Winner: {name}"
+        else:
+            # Only add 's' unit for time-based labels
+            if label.lower() in ("it", "time"):
+                def format_value(value: float) -> str:
+                    return f"{value:.1f}s"
+            else:
+                def format_value(value: float) -> str:
+                    return f"{int(value)}"
+
+            def format_row(i: int, name: str, value: float) -> str:
+                return f"{i+1}. {name} — {label}: {format_value(value)}"
+
+            def format_winner(name: str, value: float) -> str:
+                return f"Winner: {name} ({label}: {format_value(value)})"
+
+        if header:
+            header_text = str(header)
+
+            def format_winner(name: str, value: float) -> str:
+                return header_text
+
+        return format_row, format_winner
+
+    def _button_at(self, pos: tuple[int, int]) -> int:
+        """Index of the button under pos, or -1."""
+        return _grid_hit(pos, self._grid, 1, len(self._rects))
+
+    def hover(self, pos: tuple[int, int]):
+        i = self._button_at(pos)
+        if i >= 0:
+            self.selected = i
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w, pygame.K_a):
+            if event.key in _KEYS_PREV:
                 self.selected = (self.selected - 1) % len(self.items)
-            elif event.key in (pygame.K_DOWN, pygame.K_s, pygame.K_d):
+            elif event.key in _KEYS_NEXT:
                 self.selected = (self.selected + 1) % len(self.items)
             elif event.key == pygame.K_RETURN:
                 self._activate_selected()
             elif event.key == pygame.K_ESCAPE:
-                self.app.scene_manager.set(HomeScene(self.app))
-        elif event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-            for i, r in enumerate(self._button_rects()):
-                if r.collidepoint(mx, my):
-                    self.selected = i
-                    break
+                self.app.go(HomeScene)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            for i, r in enumerate(self._button_rects()):
-                if r.collidepoint(mx, my):
-                    self.selected = i
-                    self._activate_selected()
-                    break
+            i = self._button_at(event.pos)
+            if i >= 0:
+                self.selected = i
+                self._activate_selected()
         elif event.type == pygame.MOUSEWHEEL:
             if event.y > 0:
                 self.selected = (self.selected - 1) % len(self.items)
@@ -1330,72 +1697,93 @@ class ResultsScene(Scene):
             if hasattr(self.app, "current_game_launcher") and self.app.current_game_launcher:
                 self.app.current_game_launcher()
         elif label == "Main Menu":
-            self.app.scene_manager.set(HomeScene(self.app))
+            self.app.go(HomeScene)
 
     def update(self, dt: float):
         pass
 
-    def draw(self, surface: pygame.Surface):
-        surface.fill(BG_COLOR)
-        title = self.big_font.render("Results", True, (255, 255, 255))
-        surface.blit(title, (WIDTH//2 - title.get_width()//2, 80))
+    def invalidate(self):
+        self._drawn = None
+
+    def _draw_button(self, surface: pygame.Surface, i: int):
+        selected = i == self.selected
+        key = (i, selected)
+        button = self._button_surfs.get(key)
+        if button is None:
+            rect = self._rects[i]
+            button = pygame.Surface(rect.size).convert()
+            box = button.get_rect()
+            fill = (120, 120, 180) if selected else (70, 70, 90)
+            pygame.draw.rect(button, fill, box)
+            pygame.draw.rect(button, (180, 180, 220), box, 2)
+            btn = cached_text(self.font, self.items[i], (240, 240, 240))
+            button.blit(btn.surf, btn.centered(box.centerx, box.centery))
+            self._button_surfs[key] = button
+        surface.blit(button, self._rects[i])
+
+    def _background(self) -> pygame.Surface:
+        """Pre-render the title, winner line and every score row.
+
+        Winner and row strings are one-off per match and end up baked into
+        the backdrop, so they are rendered directly rather than cached.
+        """
+        bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        bg.fill(BG_COLOR)
+        title = self._title
+        # Text is queued and handed to Surface.blits() after the shapes under it
+        texts = [(title.surf, (WIDTH//2 - title.w//2, 80))]
 
         if self.sorted_scores:
             winner, t = self.sorted_scores[0]
-            show_values = (not getattr(self.game, "higher_time_wins", False)) or getattr(self.game, "show_time_in_results", False)
-            label = getattr(self.game, "result_label", "IT")
-            # Only add 's' unit for time-based labels
-            is_time_label = label.lower() in ("it", "time")
-            if hasattr(self.game, "results_header") and getattr(self.game, "results_header"):
-                wtext = self.font.render(str(getattr(self.game, "results_header")), True, (240, 240, 240))
-            elif show_values:
-                val_text = f"{t:.1f}s" if is_time_label else f"{int(t)}"
-                wtext = self.font.render(f"Winner: {winner} ({label}: {val_text})", True, (240, 240, 240))
-            else:
-                wtext = self.font.render(f"Winner: {winner}", True, (240, 240, 240))
+            wtext = self.font.render(self._format_winner(winner, t), True, (240, 240, 240))
+            w, h = wtext.get_size()
             # Draw color swatch next to winner
             win_color = self.name_colors.get(winner)
-            x_text = WIDTH//2 - wtext.get_width()//2
+            x_text = WIDTH//2 - w//2
             y_text = 140
             if win_color:
                 box_size = 14
                 box_x = x_text - box_size - 8
-                box_y = y_text + (wtext.get_height() - box_size)//2
+                box_y = y_text + (h - box_size)//2
                 box = pygame.Rect(box_x, box_y, box_size, box_size)
-                pygame.draw.rect(surface, win_color, box)
-                pygame.draw.rect(surface, (230, 230, 230), box, 2)
-            surface.blit(wtext, (x_text, y_text))
+                pygame.draw.rect(bg, win_color, box)
+                pygame.draw.rect(bg, (230, 230, 230), box, 2)
+            texts.append((wtext, (x_text, y_text)))
 
-        show_values = (not getattr(self.game, "higher_time_wins", False)) or getattr(self.game, "show_time_in_results", False)
+        format_row = self._format_row
         for i, (name, it_time) in enumerate(self.sorted_scores):
-            if show_values:
-                label = getattr(self.game, "result_label", "IT")
-                is_time_label = label.lower() in ("it", "time")
-                val_text = f"{it_time:.1f}s" if is_time_label else f"{int(it_time)}"
-                line = f"{i+1}. {name} — {label}: {val_text}"
-            else:
-                line = f"{i+1}. {name}"
-            surf = self.font.render(line, True, (220, 220, 220))
+            row = self.font.render(format_row(i, name, it_time), True, (220, 220, 220))
+            w, h = row.get_size()
             # Draw color swatch next to each entry
             color = self.name_colors.get(name)
-            line_x = WIDTH//2 - surf.get_width()//2
+            line_x = WIDTH//2 - w//2
             line_y = 180 + i * 26
             if color:
                 box_size = 12
                 box_x = line_x - box_size - 8
-                box_y = line_y + (surf.get_height() - box_size)//2
+                box_y = line_y + (h - box_size)//2
                 box = pygame.Rect(box_x, box_y, box_size, box_size)
-                pygame.draw.rect(surface, color, box)
-                pygame.draw.rect(surface, (220, 220, 220), box, 2)
-            surface.blit(surf, (line_x, line_y))
-
-        for i, label in enumerate(self.items):
-            rect = self._button_rects()[i]
-            fill = (120, 120, 180) if i == self.selected else (70, 70, 90)
-            pygame.draw.rect(surface, fill, rect)
-            pygame.draw.rect(surface, (180, 180, 220), rect, 2)
-            surf = self.font.render(label, True, (240, 240, 240))
-            surface.blit(surf, (rect.centerx - surf.get_width()//2, rect.centery - surf.get_height()//2))
+                pygame.draw.rect(bg, color, box)
+                pygame.draw.rect(bg, (220, 220, 220), box, 2)
+            texts.append((row, (line_x, line_y)))
+        bg.blits(texts, doreturn=False)
+        return bg
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        # Only the button highlight changes after the first frame
+        prev = self._drawn
+        self._drawn = self.selected
+        if prev is not None:
+            if prev == self.selected:
+                return []
+            self._draw_button(surface, prev)
+            self._draw_button(surface, self.selected)
+            return [self._rects[prev], self._rects[self.selected]]
+
+        surface.blit(self._bg, (0, 0))
+        for i in range(len(self.items)):
+            self._draw_button(surface, i)
+        return None
 
     def _button_rects(self) -> list[pygame.Rect]:
         box_w = 300
@@ -1409,6 +1797,8 @@ class ResultsScene(Scene):
 
 
 class PauseScene(BaseMenuScene):
+    __slots__ = ()
+
     def __init__(self, app: "App"):
         items = ["Resume", "Restart", "Quit to Menu"]
         super().__init__(app, "Paused", items)
@@ -1422,15 +1812,17 @@ class PauseScene(BaseMenuScene):
             if hasattr(self.app, "_active_game_scene") and self.app._active_game_scene:
                 self.app.scene_manager.set(self.app._active_game_scene)
             else:
-                self.app.scene_manager.set(HomeScene(self.app))
+                self.app.go(HomeScene)
         elif label == "Restart":
             if hasattr(self.app, "current_game_launcher") and self.app.current_game_launcher:
                 self.app.current_game_launcher()
         elif label == "Quit to Menu":
-            self.app.scene_manager.set(HomeScene(self.app))
+            self.app.go(HomeScene)
 
 
 class TttSingleLevelSelectScene(BaseMenuScene):
+    __slots__ = ()
+
     def __init__(self, app: "App"):
         items = ["Easy", "Medium", "Hard", "Back"]
         super().__init__(app, "Tic Tac Toe Difficulty", items)
@@ -1438,12 +1830,14 @@ class TttSingleLevelSelectScene(BaseMenuScene):
     def handle_select(self, index: int):
         label = self.items[index]
         if label == "Back":
-            self.app.scene_manager.set(GameSelectScene(self.app))
+            self.app.go(GameSelectScene)
             return
         level = label.lower()
         self.app.launch_ttt_single(level)
 
 class SudokuLevelSelectScene(BaseMenuScene):
+    __slots__ = ()
+
     def __init__(self, app: "App"):
         items = ["Easy", "Medium", "Hard", "Back"]
         super().__init__(app, "Sudoku Difficulty", items)
@@ -1451,7 +1845,7 @@ class SudokuLevelSelectScene(BaseMenuScene):
     def handle_select(self, index: int):
         label = self.items[index]
         if label == "Back":
-            self.app.scene_manager.set(GameSelectScene(self.app))
+            self.app.go(GameSelectScene)
             return
         level = label.lower()
         self.app.launch_sudoku_game(level)
@@ -1460,63 +1854,144 @@ class SudokuLevelSelectScene(BaseMenuScene):
 class App:
     def __init__(self):
         pygame.init()
+        # Shut pygame down however the process exits
+        atexit.register(pygame.quit)
         pygame.display.set_caption("Box Arcade - TAG")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("consolas", 20)
-        self.big_font = pygame.font.SysFont("consolas", 36)
-
-        # Load input handler (creates default JSON if missing)
+        # Prefer SDL's renderer path with vsync; fall back to a plain
+        # software window where no accelerated renderer is available.
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+            # When flip() blocks on vsync it paces frames by itself
+            self.vsync = self._flip_waits_for_vsync()
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            self.vsync = False
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_ALLOWED_EVENTS)
+        # Cleared by scenes that want to exit; checked once per frame
+        self.running = True
+        self.font = _sysfont("consolas", 20)
+        self.big_font = _sysfont("consolas", 36)
+
+        # Raw binding names (creates default JSON if missing), parsed once
+        # and shared by the input handler and the menus. ControlsScene
+        # edits this dict in place and writes it back when a key is rebound.
         cfg_path = os.path.join(os.path.dirname(__file__), "keybindings.json")
-        self.input_handler = InputHandler.from_file(cfg_path)
+        self.keybindings_path = cfg_path
+        self.keybindings = InputHandler.load_bindings(cfg_path)
+        self.input_handler = InputHandler.from_dict(self.keybindings)
+        self._binding_labels: dict[tuple[str, str | None], str] = {}
 
         self.lobby = LobbyState()
         self.current_game_launcher = None
         self._active_game_scene = None
+        # Tic Tac Toe PvP: persistent scoreboard and alternating assignment
+        self.ttt_pvp_scores = {"P1": 0, "P2": 0}
+        self.ttt_pvp_toggle = True  # True: P1 gets X first; then alternate
+        # Tic Tac Toe solo: one persistent scoreboard per difficulty
+        self.ttt_single_scores_by_level = {
+            level: {"You": 0, "Bot": 0} for level in ("easy", "medium", "hard")
+        }
+        # Menu scenes hold no per-visit state worth rebuilding, so keep one
+        # instance of each and reuse it when navigating back.
+        self._scene_pool: dict[type, Scene] = {}
         # Start at Home scene for lobby/system navigation
-        self.scene_manager = SceneManager(HomeScene(self))
+        self.scene_manager = SceneManager(self.scene(HomeScene))
+
+    @staticmethod
+    def _flip_waits_for_vsync() -> bool:
+        """Time a few flips to see whether vsync actually blocks.
+
+        SDL can accept vsync=1 and still present immediately (e.g. with a
+        software renderer), in which case frames must be paced by hand. A
+        slow present is not proof of vsync either, so the flip interval has
+        to match the display's refresh period to within 25%.
+        """
+        try:
+            rate = pygame.display.get_current_refresh_rate()
+        except (AttributeError, pygame.error):
+            # Only pygame-ce can report the refresh rate; assume 60 Hz
+            rate = 0
+        period = 1.0 / (rate if rate > 0 else 60)
+        flips = 6
+        # The first flip only lines us up with the next vblank
+        pygame.display.flip()
+        start = time.perf_counter()
+        for _ in range(flips):
+            pygame.display.flip()
+        interval = (time.perf_counter() - start) / flips
+        return abs(interval - period) <= period * 0.25
+
+    def binding_label(self, pid: str, prefix: str | None = None) -> str:
+        """Return "P<pid>: up=... down=... left=... right=..." for a player.
+
+        Labels are built once per player and reused every frame until
+        bindings_changed() is called after a rebind.
+        """
+        key = (pid, prefix)
+        label = self._binding_labels.get(key)
+        if label is None:
+            actions = self.keybindings.get("players", {}).get(pid, {})
+            label = (
+                f"{prefix or f'P{pid}:'} up={actions.get('up','')} down={actions.get('down','')} "
+                f"left={actions.get('left','')} right={actions.get('right','')}"
+            )
+            self._binding_labels[key] = label
+        return label
+
+    def bindings_changed(self):
+        """Drop cached binding labels after keybindings was edited."""
+        self._binding_labels.clear()
+
+    def scene(self, cls: type) -> Scene:
+        """Return the pooled instance of a menu scene, creating it on first use."""
+        scene = self._scene_pool.get(cls)
+        if scene is None:
+            scene = self._scene_pool[cls] = cls(self)
+        return scene
+
+    def go(self, cls: type):
+        """Switch to the pooled instance of a menu scene."""
+        self.scene_manager.set(self.scene(cls))
+
+    def _enter_game(self, game: Any, relauncher=None):
+        """Start a game scene; relauncher, if given, backs "Play Again"/"Restart"."""
+        scene = GameScene(self, game)
+        self._active_game_scene = scene
+        if relauncher is not None:
+            self.current_game_launcher = relauncher
+        self.scene_manager.set(scene)
+
+    def _launch(self, key: str):
+        """Start a GAME_REGISTRY game; "Play Again" relaunches the same key."""
+        module, cls_name, bounds, kwargs = GAME_REGISTRY[key]
+        game_cls = getattr(importlib.import_module(module), cls_name)
+        game = game_cls(bounds, **kwargs)
+        game.reset()
+        self._enter_game(game, partial(self._launch, key))
 
     def launch_tag_game(self, num_players: int):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        spawn_positions = [
-            (bounds.left + 40, bounds.top + 40),
-            (bounds.right - 80, bounds.top + 40),
-            (bounds.left + 40, bounds.bottom - 80),
-            (bounds.right - 80, bounds.bottom - 80),
-            (bounds.centerx - 40, bounds.centery - 40),
-            (bounds.centerx + 40, bounds.centery - 40),
-            (bounds.centerx - 40, bounds.centery + 40),
-            (bounds.centerx + 40, bounds.centery + 40),
-        ]
-        players: List[Player] = []
-        speed = 220.0
+        from games.tag import TagGame, TagSettings
         # Slightly smaller player boxes so arena feels larger
-        size = 28
-        for i in range(num_players):
-            x, y = spawn_positions[i % len(spawn_positions)]
-            rect = pygame.Rect(x, y, size, size)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            players.append(HumanPlayer(i + 1, f"P{i+1}", rect, color, speed, True))
+        players = _make_players(num_players, 28, 220.0, TAG_SPAWNS)
 
         # Build Tag settings from lobby
         lobby = self.lobby
-        settings = {
-            "double_jump": getattr(lobby, "tag_double_jump", False),
-            "map_index": getattr(lobby, "tag_map_index", 0),
-            "enable_moving": getattr(lobby, "tag_enable_moving", False),
-            "enable_dropthrough": getattr(lobby, "tag_enable_dropthrough", False),
-            "enable_speed": getattr(lobby, "tag_enable_speed", False),
-        }
+        settings = TagSettings(
+            double_jump=lobby.tag_double_jump,
+            map_index=lobby.tag_map_index,
+            enable_moving=lobby.tag_enable_moving,
+            enable_dropthrough=lobby.tag_enable_dropthrough,
+            enable_speed=lobby.tag_enable_speed,
+        )
 
-        game = TagGame(players, bounds, match_time=60, settings=settings)
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda: self.launch_tag_game(num_players)
-        self.scene_manager.set(scene)
+        game = TagGame(players, TAG_BOUNDS, match_time=60, settings=settings)
+        self._enter_game(game, partial(self.launch_tag_game, num_players))
 
     def launch_survival_game(self):
+        from games.survival import SurvivalGame
         # Single player in arena; reuse existing movement and input systems
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
+        bounds = ARENA_BOUNDS
         size = 36
         speed = 220.0
         # Center spawn
@@ -1527,71 +2002,32 @@ class App:
 
         game = SurvivalGame(player, bounds)
         game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_survival_game
-        self.scene_manager.set(scene)
+        self._enter_game(game, self.launch_survival_game)
 
     def launch_snake_game(self):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        game = SnakeGame(bounds)
-        # Optional: ensure clean start
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_snake_game
-        self.scene_manager.set(scene)
+        self._launch("snake")
 
     def launch_brick_breaker_game(self):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        game = BrickBreakerGame(bounds)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_brick_breaker_game
-        self.scene_manager.set(scene)
+        self._launch("brick_breaker")
 
     def launch_whack_a_box_game(self):
-        bounds = pygame.Rect(40, 80, WIDTH - 80, HEIGHT - 140)
-        game = WhackABoxGame(bounds, round_duration=30.0)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_whack_a_box_game
-        self.scene_manager.set(scene)
+        self._launch("whack_a_box")
 
     def launch_flappy_box_game(self):
-        bounds = pygame.Rect(80, 60, WIDTH - 160, HEIGHT - 120)
-        game = FlappyBoxGame(bounds)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_flappy_box_game
-        self.scene_manager.set(scene)
+        self._launch("flappy_box")
 
     def launch_tetris_box_game(self):
-        # Slight margins so the 10x20 grid and side HUD fit cleanly
-        bounds = pygame.Rect(60, 40, WIDTH - 120, HEIGHT - 80)
-        game = TetrisBoxGame(bounds)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_tetris_box_game
-        self.scene_manager.set(scene)
+        self._launch("tetris_box")
 
     def launch_zip_box_game(self):
-        # Central board area for the numbered-grid puzzle.
+        from games.zip_box import ZipBoxGame
         # For Zip Box we keep a single game instance and reuse it so
         # that "Play Again" can advance to the next level while
         # pause-menu "Restart" restarts the current level.
-        bounds = pygame.Rect(60, 60, WIDTH - 120, HEIGHT - 120)
-        game = ZipBoxGame(bounds)
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
+        game = ZipBoxGame(ZIP_BOUNDS)
         # Launcher decides whether to restart or go to next level based
         # on which scene is currently active (Pause vs Results).
-        self.current_game_launcher = lambda g=game: self._restart_or_advance_zip_box(g)
-        self.scene_manager.set(scene)
+        self._enter_game(game, partial(self._restart_or_advance_zip_box, game))
 
     def _restart_or_advance_zip_box(self, game: ZipBoxGame):
         """Helper used by current_game_launcher for Zip Box.
@@ -1611,157 +2047,192 @@ class App:
             # From pause or other callers, just restart this level.
             game.reset()
 
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.scene_manager.set(scene)
+        self._enter_game(game)
 
     def launch_box_stack_game(self):
-        bounds = pygame.Rect(120, 80, WIDTH - 240, HEIGHT - 140)
-        game = BoxStackGame(bounds)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_box_stack_game
-        self.scene_manager.set(scene)
+        self._launch("box_stack")
 
     def launch_simon_grid_game(self):
-        # Square-ish board area centered with top HUD room
-        bounds = pygame.Rect(140, 80, WIDTH - 280, HEIGHT - 160)
-        game = SimonGridGame(bounds, grid_size=3)
-        # game.reset() not required (constructor calls reset), but safe to ensure
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_simon_grid_game
-        self.scene_manager.set(scene)
+        self._launch("simon_grid")
 
     def launch_maze_runner_game(self):
-        bounds = pygame.Rect(40, 60, WIDTH - 80, HEIGHT - 120)
-        game = MazeRunnerGame(bounds)
-        game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_maze_runner_game
-        self.scene_manager.set(scene)
+        self._launch("maze_runner")
 
     def launch_sudoku_game(self, level: str = "easy"):
-        # Centered board with margin for HUD
-        bounds = pygame.Rect(100, 60, WIDTH - 200, HEIGHT - 120)
-        game = SudokuGame(bounds, level=level)
+        from games.sudoku import SudokuGame
+        game = SudokuGame(SUDOKU_BOUNDS, level=level)
         game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda lvl=level: self.launch_sudoku_game(lvl)
-        self.scene_manager.set(scene)
+        self._enter_game(game, partial(self.launch_sudoku_game, level))
 
     def launch_survival_pvp_game(self, num_players: int):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        size = 36
-        speed = 220.0
-        players: List[HumanPlayer] = []
-        # Spawn colors & IDs
-        for i in range(num_players):
-            rect = pygame.Rect(0, 0, size, size)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            players.append(HumanPlayer(i + 1, f"P{i+1}", rect, color, speed, True))
-        game = SurvivalPvpGame(players, bounds)
+        from games.survival import SurvivalPvpGame
+        players = _make_players(num_players, 36, 220.0)
+        game = SurvivalPvpGame(players, ARENA_BOUNDS)
         game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda: self.launch_survival_pvp_game(num_players)
-        self.scene_manager.set(scene)
+        self._enter_game(game, partial(self.launch_survival_pvp_game, num_players))
 
     def launch_control_zone_game(self, num_players: int):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        size = 36
-        speed = 220.0
-        players: List[HumanPlayer] = []
-        for i in range(num_players):
-            rect = pygame.Rect(0, 0, size, size)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            players.append(HumanPlayer(i + 1, f"P{i+1}", rect, color, speed, True))
-        game = ControlZoneGame(players, bounds, match_time=60.0)
+        from games.control_zone import ControlZoneGame
+        players = _make_players(num_players, 36, 220.0)
+        game = ControlZoneGame(players, ARENA_BOUNDS, match_time=60.0)
         game.reset()
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda: self.launch_control_zone_game(num_players)
-        self.scene_manager.set(scene)
+        self._enter_game(game, partial(self.launch_control_zone_game, num_players))
 
     def launch_trail_lock_game(self, num_players: int):
-        bounds = pygame.Rect(20, 60, WIDTH - 40, HEIGHT - 80)
-        size = 28
-        speed = 170.0
-        players: List[HumanPlayer] = []
-        for i in range(num_players):
-            rect = pygame.Rect(0, 0, size, size)
-            color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-            players.append(HumanPlayer(i + 1, f"P{i+1}", rect, color, speed, True))
-        game = TrailLockGame(players, bounds, target_score=5)
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda: self.launch_trail_lock_game(num_players)
-        self.scene_manager.set(scene)
+        from games.trail_lock import TrailLockGame
+        players = _make_players(num_players, 28, 170.0)
+        game = TrailLockGame(players, ARENA_BOUNDS, target_score=5)
+        self._enter_game(game, partial(self.launch_trail_lock_game, num_players))
 
     def launch_ttt_single(self, level: str = "hard"):
+        from games.tictactoe import TicTacToeGame
         # Persistent scoreboard across replays
-        if not hasattr(self, "ttt_single_scores_by_level"):
-            self.ttt_single_scores_by_level = {}
-        scoreboard = self.ttt_single_scores_by_level.setdefault(level, {"You": 0, "Bot": 0})
+        scoreboard = self.ttt_single_scores_by_level[level]
         # Randomize who is X and who starts
         human_is_x = bool(random.getrandbits(1))
         start_symbol = random.choice(['X', 'O'])
-        bounds = pygame.Rect(120, 100, WIDTH - 240, HEIGHT - 200)
+        bounds = TTT_BOUNDS
         game = TicTacToeGame(bounds, mode="single",
                      player_names=("You", "Bot"),
                      scoreboard=scoreboard,
                              human_symbol=('X' if human_is_x else 'O'),
                              start_symbol=start_symbol,
                              ai_level=level)
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = lambda lvl=level: self.launch_ttt_single(lvl)
-        self.scene_manager.set(scene)
+        self._enter_game(game, partial(self.launch_ttt_single, level))
 
     def launch_ttt_pvp(self):
-        # Persistent scoreboard and alternating assignment
-        if not hasattr(self, "ttt_pvp_scores"):
-            self.ttt_pvp_scores = {"P1": 0, "P2": 0}
-        if not hasattr(self, "ttt_pvp_toggle"):
-            self.ttt_pvp_toggle = True  # True: P1 gets X first; then alternate
-        bounds = pygame.Rect(120, 100, WIDTH - 240, HEIGHT - 200)
-        # Determine starting assignment and starting player alternately
-        if self.ttt_pvp_toggle:
-            # P1 as X, starts
-            start_symbol = 'X'
-            names = ("P1", "P2")
-        else:
-            start_symbol = 'O'
-            names = ("P1", "P2")
+        from games.tictactoe import TicTacToeGame
+        bounds = TTT_BOUNDS
+        # Alternate the starting symbol; P1 is always X
+        start_symbol = 'X' if self.ttt_pvp_toggle else 'O'
         game = TicTacToeGame(bounds, mode="pvp",
-                             player_names=names,
+                             player_names=TTT_PVP_NAMES,
                              scoreboard=self.ttt_pvp_scores,
                              start_symbol=start_symbol)
         # Flip toggle for next game
         self.ttt_pvp_toggle = not self.ttt_pvp_toggle
-        scene = GameScene(self, game)
-        self._active_game_scene = scene
-        self.current_game_launcher = self.launch_ttt_pvp
-        self.scene_manager.set(scene)
+        self._enter_game(game, self.launch_ttt_pvp)
 
     def run(self):
-        while True:
-            dt = self.clock.tick(60) / 1000.0  # seconds
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit(0)
-                # Update unified input state for KEYDOWN/KEYUP across scenes
-                self.input_handler.handle_event(event)
-                self.scene_manager.current.handle_event(event)
-
-            self.scene_manager.current.update(dt)
-            self.scene_manager.current.draw(self.screen)
-            pygame.display.flip()
+        # Bind everything the loop touches to locals once
+        perf_counter_ns = time.perf_counter_ns
+        event_get = pygame.event.get
+        event_peek = pygame.event.peek
+        flip = pygame.display.flip
+        update_rects = pygame.display.update
+        sm = self.scene_manager
+        screen = self.screen
+        event_wait = pygame.event.wait
+        get_mouse_pos = pygame.mouse.get_pos
+        vsync = self.vsync
+        QUIT = pygame.QUIT
+        KEYDOWN = pygame.KEYDOWN
+        KEYUP = pygame.KEYUP
+        MOUSEMOTION = pygame.MOUSEMOTION
+        WINDOWEXPOSED = pygame.WINDOWEXPOSED
+        NOEVENT = pygame.NOEVENT
+        # Simulation advances in fixed steps; rendering happens once per frame
+        acc = 0
+        prev = perf_counter_ns()
+        next_frame = prev + FRAME_TIME_NS
+        motion_scene = None  # scene MOUSEMOTION blocking was last set up for
+        mouse_pos = get_mouse_pos()
+        while self.running:
+            scene = sm.current
+            # Animated scenes handle input as soon as it arrives and are
+            # paced just before presenting (by flip itself under vsync);
+            # static ones block for input here
+            animated = scene.needs_animation
+            precise = scene.precise_timing
+            if animated:
+                # Most animated frames have no input; skip building a list
+                events = event_get(_ALLOWED_EVENTS) if event_peek(_ALLOWED_EVENTS) else ()
+            else:
+                # Static scene: sleep until input arrives (or a short timeout)
+                first = event_wait(IDLE_WAIT_MS)
+                events = event_get(_ALLOWED_EVENTS)
+                if first.type != NOEVENT:
+                    events.insert(0, first)
+            now = perf_counter_ns()
+            acc += now - prev
+            prev = now
+            if next_frame < now:
+                # Missed the deadline (or were idle): restart pacing from now
+                next_frame = now + FRAME_TIME_NS
+            # Re-read each frame: ControlsScene swaps in a new handler on rebind
+            handle_input = self.input_handler.handle_event
+            handle_scene = scene.handle_event
+            for event in events:
+                t = event.type
+                if t == QUIT:
+                    self.running = False
+                    break
+                if t == WINDOWEXPOSED:
+                    # Window contents were lost; repaint the whole scene
+                    scene.invalidate()
+                    continue
+                if t == MOUSEMOTION and not scene.wants_mouse_motion:
+                    # Only woke a static scene; the cursor poll below
+                    # turns however many arrived into one hover()
+                    continue
+                # Update unified input state for KEYDOWN/KEYUP across scenes;
+                # the handler ignores everything else, so don't call it
+                if t == KEYDOWN or t == KEYUP:
+                    handle_input(event)
+                handle_scene(event)
+                # A handler may switch scenes; later events go to the new one
+                if sm.current is not scene:
+                    scene = sm.current
+                    handle_scene = scene.handle_event
+
+            scene = sm.current
+            if scene is not motion_scene:
+                # Entering a scene: set up motion events, but don't treat
+                # the cursor's current position as a hover. Static scenes
+                # keep them so moving the mouse wakes event_wait; animated
+                # ones poll every frame anyway.
+                motion_scene = scene
+                if scene.wants_mouse_motion or not scene.needs_animation:
+                    pygame.event.set_allowed(MOUSEMOTION)
+                else:
+                    pygame.event.set_blocked(MOUSEMOTION)
+                mouse_pos = get_mouse_pos()
+            elif not scene.wants_mouse_motion:
+                # One cursor read per frame, however fast the mouse reports
+                pos = get_mouse_pos()
+                if pos != mouse_pos:
+                    mouse_pos = pos
+                    scene.hover(pos)
+
+            if scene.paused:
+                # Nothing to simulate; don't let time pile up either
+                acc = 0
+            update = scene.update
+            steps = 0
+            while acc >= FIXED_DT_NS:
+                update(FIXED_DT)
+                acc -= FIXED_DT_NS
+                # update() may switch scenes (e.g. game over -> results)
+                if sm.current is not scene:
+                    scene = sm.current
+                    update = scene.update
+                steps += 1
+                if steps == MAX_STEPS_PER_FRAME:
+                    # Fell too far behind (stall, window drag): drop the backlog
+                    acc = 0
+                    break
+            dirty = scene.draw(screen)
+            # Under vsync only presenting blocks; a frame with nothing to
+            # present would otherwise spin, so pace it here instead
+            if animated and (not vsync or dirty == []):
+                _sleep_until(next_frame, precise)
+                next_frame += FRAME_TIME_NS
+            if dirty is None:
+                flip()
+            elif dirty:
+                update_rects(dirty)
+
+        sys.exit(0)
 
 
 if __name__ == "__main__":